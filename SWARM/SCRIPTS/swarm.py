@@ -1,87 +1,175 @@
 #!/usr/bin/env python3
 """Zerg Rush Swarm Manager CLI"""
-import json, sys, time, os
+import argparse, atexit, contextlib, json, queue, sys, time, os
 from datetime import datetime
 from pathlib import Path
 import logging
+import logging.handlers
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Setup logging
-SWARM_ROOT_TEMP = Path(__file__).parent.parent
-LOG_DIR = SWARM_ROOT_TEMP / "LOGS"
-LOG_DIR.mkdir(exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_DIR / "swarm.log"),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
-SWARM_ROOT = SWARM_ROOT_TEMP
+SWARM_ROOT = Path(__file__).parent.parent
+LOG_DIR = SWARM_ROOT / "LOGS"
 STATE_FILE = SWARM_ROOT / "STATE.json"
 OUTBOX_DIR = SWARM_ROOT / "OUTBOX"
 INBOX_DIR = SWARM_ROOT / "INBOX"
 LOCKS_DIR = SWARM_ROOT / "LOCKS"
+TASKS_DIR = SWARM_ROOT / "TASKS"
+
+LANES = ('KERNEL', 'ML', 'QUANT', 'DEX', 'INTEGRATION')
+
+# Parsed STATE.json keyed on (st_ino, st_mtime_ns, st_size) of the file it came
+# from; writes replace the file, so the inode changes even within one mtime tick
+_STATE_CACHE = {}
+
+# fd holding the STATE.lock flock while a write is in progress
+_lock_fd = None
 
 def acquire_lock(timeout=5):
-    """Acquire lock for STATE.json modification."""
-    lock_file = LOCKS_DIR / "STATE.lock"
+    """Acquire lock for STATE.json modification.
+
+    Uses an OS-level advisory lock on LOCKS/STATE.lock, which the kernel
+    releases automatically if the process dies, so no stale lock is left.
+    """
+    global _lock_fd
     LOCKS_DIR.mkdir(exist_ok=True)
-    start = time.time()
-    while lock_file.exists():
-        if time.time() - start > timeout:
-            raise TimeoutError("Could not acquire lock")
-        time.sleep(0.1)
-    lock_file.write_text(str(os.getpid()))
-    return lock_file
+    fd = os.open(LOCKS_DIR / "STATE.lock", os.O_CREAT | os.O_RDWR, 0o600)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            break
+        except OSError:
+            if time.monotonic() > deadline:
+                os.close(fd)
+                raise TimeoutError("Could not acquire lock")
+            time.sleep(0.005)
+    _lock_fd = fd
+    return fd
 
 def release_lock():
     """Release lock for STATE.json."""
-    lock_file = LOCKS_DIR / "STATE.lock"
-    if lock_file.exists():
-        lock_file.unlink()
+    global _lock_fd
+    if _lock_fd is None:
+        return
+    if not fcntl:
+        msvcrt.locking(_lock_fd, msvcrt.LK_UNLCK, 1)
+    os.close(_lock_fd)  # Closing the fd drops the flock
+    _lock_fd = None
+
+def _now_iso():
+    """Current local time as ISO 8601, the format every STATE.json writer uses."""
+    return datetime.now().isoformat()
+
+def _copy_state(state):
+    """Copy state so callers can mutate it without touching the cache."""
+    return {k: list(v) if isinstance(v, list) else v for k, v in state.items()}
 
 def load_state():
     logger.info("Loading state from %s", STATE_FILE)
     try:
         if not STATE_FILE.exists():
-            return {"wave": 0, "active_zerglings": [], "completed_tasks": [], "pending_tasks": [], "last_updated": datetime.now().isoformat()}
-        with open(STATE_FILE) as f:
-            state = json.load(f)
+            return {"wave": 0, "active_zerglings": [], "completed_tasks": [], "pending_tasks": [], "last_updated": _now_iso()}
+        st = STATE_FILE.stat()
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = _STATE_CACHE.get(key)
+        if cached is not None:
+            return _copy_state(cached)
+        data = STATE_FILE.read_bytes()
+        state = orjson.loads(data) if orjson else json.loads(data)
         # Validate required keys
         required = ['wave', 'active_zerglings', 'completed_tasks', 'pending_tasks', 'last_updated']
-        for key in required:
-            if key not in state:
-                if key.endswith('s'):
-                    state[key] = []
-                elif key == 'wave':
-                    state[key] = 0
+        for key_name in required:
+            if key_name not in state:
+                if key_name.endswith('s'):
+                    state[key_name] = []
+                elif key_name == 'wave':
+                    state[key_name] = 0
                 else:
-                    state[key] = ''
-        return state
-    except (json.JSONDecodeError, FileNotFoundError) as e:
+                    state[key_name] = ''
+        _STATE_CACHE.clear()
+        _STATE_CACHE[key] = state
+        return _copy_state(state)
+    except (ValueError, FileNotFoundError) as e:
         print(f"Error loading state: {e}", file=sys.stderr)
         return {"wave": 0, "active_zerglings": [], "completed_tasks": [], "pending_tasks": [], "last_updated": ""}
 
-def save_state(state):
+def _dumps(state):
+    """Serialize state to indented JSON bytes."""
+    if orjson:
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(state, indent=2).encode()
+
+def _write_state(state):
+    """Atomically write state to STATE_FILE. Caller must hold the lock."""
     logger.info("Saving state: wave=%d, pending=%d, completed=%d", state.get('wave', 0), len(state.get('pending_tasks', [])), len(state.get('completed_tasks', [])))
-    lock = acquire_lock()
+    temp_file = STATE_FILE.with_suffix('.json.tmp')
     try:
-        state["last_updated"] = datetime.now().isoformat()
-        temp_file = STATE_FILE.with_suffix('.json.tmp')
-        with open(temp_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        state["last_updated"] = _now_iso()
+        temp_file.write_bytes(_dumps(state))
         temp_file.replace(STATE_FILE)  # Atomic rename
-    except (IOError, json.JSONDecodeError) as e:
+    except (IOError, TypeError, ValueError) as e:
         print(f"Error saving state: {e}", file=sys.stderr)
         if temp_file.exists():
             temp_file.unlink()
         raise
+
+def save_state(state):
+    acquire_lock()
+    try:
+        _write_state(state)
+    finally:
+        release_lock()
+
+@contextlib.contextmanager
+def state_transaction():
+    """Lock, load and yield state once; write it back on clean exit.
+
+    The write is skipped when the yielded state was not modified.
+    """
+    acquire_lock()
+    try:
+        state = load_state()
+        original = _copy_state(state)
+        yield state
+        if state != original:
+            _write_state(state)
     finally:
         release_lock()
 
+def _count_md(d):
+    """Count *.md entries in d without building Path objects."""
+    if not d.exists():
+        return 0
+    with os.scandir(d) as it:
+        return sum(1 for e in it if e.name.endswith('.md'))
+
+def _md_names(d):
+    """Sorted *.md file names in d."""
+    with os.scandir(d) as it:
+        return sorted(e.name for e in it if e.name.endswith('.md'))
+
+def _md_stems(d):
+    """Stems of *.md files in d (empty if d is missing)."""
+    if not d.exists():
+        return ()
+    with os.scandir(d) as it:
+        return [e.name[:-3] for e in it if e.name.endswith('.md')]
+
 def cmd_status(verbose=False):
     state = load_state()
     print(f"=== SWARM STATUS ===")
@@ -90,8 +178,8 @@ def cmd_status(verbose=False):
     print(f"Pending Tasks: {len(state.get('pending_tasks', []))}")
     print(f"Completed Tasks: {len(state.get('completed_tasks', []))}")
     print(f"Last Updated: {state.get('last_updated', 'N/A')}")
-    outbox_count = len(list(OUTBOX_DIR.glob("*.md"))) if OUTBOX_DIR.exists() else 0
-    inbox_count = len(list(INBOX_DIR.glob("*.md"))) if INBOX_DIR.exists() else 0
+    outbox_count = _count_md(OUTBOX_DIR)
+    inbox_count = _count_md(INBOX_DIR)
     print(f"\nOutbox Tasks: {outbox_count}")
     print(f"Inbox Results: {inbox_count}")
     if verbose:
@@ -103,35 +191,34 @@ def cmd_status(verbose=False):
             print(f"\nCompleted Tasks (recent): {state['completed_tasks'][-5:]}")
 
 def cmd_new_wave():
-    state = load_state()
-    state['wave'] += 1
-    logger.info("Incrementing wave to %d", state['wave'])
-    save_state(state)
+    with state_transaction() as state:
+        state['wave'] += 1
+        logger.info("Incrementing wave to %d", state['wave'])
     print(f"Wave incremented to: {state['wave']}")
 
 def cmd_list_tasks():
     if not OUTBOX_DIR.exists():
         print("No tasks (OUTBOX doesn't exist)")
         return
-    tasks = list(OUTBOX_DIR.glob("*.md"))
+    tasks = _md_names(OUTBOX_DIR)
     if not tasks:
         print("No pending tasks in OUTBOX")
         return
     print(f"=== PENDING TASKS ({len(tasks)}) ===")
-    for task in sorted(tasks):
-        print(f"  - {task.name}")
+    for name in tasks:
+        print(f"  - {name}")
 
 def cmd_list_results():
     if not INBOX_DIR.exists():
         print("No results (INBOX doesn't exist)")
         return
-    results = list(INBOX_DIR.glob("*.md"))
+    results = _md_names(INBOX_DIR)
     if not results:
         print("No results in INBOX")
         return
     print(f"=== RESULTS ({len(results)}) ===")
-    for result in sorted(results):
-        print(f"  - {result.name}")
+    for name in results:
+        print(f"  - {name}")
 
 def cmd_collect():
     if not INBOX_DIR.exists():
@@ -141,104 +228,130 @@ def cmd_collect():
     if not results:
         print("No results to collect")
         return
-    state = load_state()
-    collected = 0
-    for result in results:
-        task_id = result.stem
-        if task_id not in state.get('completed_tasks', []):
-            state.setdefault('completed_tasks', []).append(task_id)
-            collected += 1
-        if task_id in state.get('pending_tasks', []):
-            state['pending_tasks'].remove(task_id)
-    save_state(state)
+    with state_transaction() as state:
+        completed = state.setdefault('completed_tasks', [])
+        completed_set = set(completed)
+        result_ids = set()
+        collected = 0
+        for result in results:
+            task_id = result.stem
+            result_ids.add(task_id)
+            if task_id not in completed_set:
+                completed_set.add(task_id)
+                completed.append(task_id)
+                collected += 1
+        state['pending_tasks'] = [t for t in state.get('pending_tasks', []) if t not in result_ids]
     logger.info("Collected %d results", collected)
     print(f"Collected {collected} new results")
     print(f"Total completed: {len(state.get('completed_tasks', []))}")
 
 def cmd_kill(task_id):
     """Remove a task from pending_tasks."""
-    state = load_state()
-    if task_id in state['pending_tasks']:
-        state['pending_tasks'].remove(task_id)
-        save_state(state)
-        logger.info("Killed task: %s", task_id)
-        print(f"Killed task: {task_id}")
-    else:
-        print(f"Task not found: {task_id}", file=sys.stderr)
+    with state_transaction() as state:
+        try:
+            state['pending_tasks'].remove(task_id)
+        except ValueError:
+            print(f"Task not found: {task_id}", file=sys.stderr)
+            return
+    logger.info("Killed task: %s", task_id)
+    print(f"Killed task: {task_id}")
 
 def cmd_reset():
     """Reset swarm state to initial values."""
-    state = {
-        'wave': 0,
-        'active_zerglings': [],
-        'completed_tasks': [],
-        'pending_tasks': [],
-        'last_updated': datetime.now().isoformat()
-    }
-    save_state(state)
+    with state_transaction() as state:
+        state.clear()
+        state.update({
+            'wave': 0,
+            'active_zerglings': [],
+            'completed_tasks': [],
+            'pending_tasks': [],
+            'last_updated': _now_iso()
+        })
     logger.info("Swarm state reset to initial values")
     print("Swarm state reset to initial values")
 
 def cmd_reconcile(fix=False):
     """Reconcile pending_tasks with actual task files."""
-    state = load_state()
-    actual_tasks = set()
-    tasks_dir = SWARM_ROOT / "TASKS"
-    for lane in ['KERNEL', 'ML', 'QUANT', 'DEX', 'INTEGRATION']:
-        lane_dir = tasks_dir / lane
-        if lane_dir.exists():
-            for f in lane_dir.glob("*.md"):
-                if f.name != "README.md":
-                    actual_tasks.add(f"{lane}/{f.stem}")
-    outbox = SWARM_ROOT / "OUTBOX"
-    if outbox.exists():
-        for f in outbox.glob("*.md"):
-            actual_tasks.add(f.stem)
-    pending = set(state['pending_tasks'])
-    missing_in_state = actual_tasks - pending
-    orphaned_in_state = pending - actual_tasks
-    print(f"Tasks in files but not in state: {len(missing_in_state)}")
-    for t in sorted(missing_in_state):
-        print(f"  + {t}")
-    print(f"Tasks in state but no file: {len(orphaned_in_state)}")
-    for t in sorted(orphaned_in_state):
-        print(f"  - {t}")
-    if fix:
-        state['pending_tasks'] = sorted(actual_tasks)
-        save_state(state)
-        print("State reconciled with task files")
-
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: swarm.py [status|wave|tasks|results|collect|kill|reset|reconcile] [options]")
-        sys.exit(1)
-    cmd = sys.argv[1].lower()
-    verbose = '-v' in sys.argv or '--verbose' in sys.argv
-    
-    if cmd == 'status':
-        cmd_status(verbose=verbose)
-    elif cmd == 'wave':
-        cmd_new_wave()
-    elif cmd == 'tasks':
-        cmd_list_tasks()
-    elif cmd == 'results':
-        cmd_list_results()
-    elif cmd == 'collect':
-        cmd_collect()
-    elif cmd == 'kill':
-        if len(sys.argv) < 3:
-            print("Usage: swarm.py kill <task_id>")
-            sys.exit(1)
-        cmd_kill(sys.argv[2])
-    elif cmd == 'reset':
-        cmd_reset()
-    elif cmd == 'reconcile':
-        fix = '--fix' in sys.argv[2:]
-        cmd_reconcile(fix=fix)
-    else:
-        print(f"Unknown command: {cmd}")
-        print("Available: status, wave, tasks, results, collect, kill, reset, reconcile")
+    # Only take the lock (and write) when fixing
+    ctx = state_transaction() if fix else contextlib.nullcontext(load_state())
+    with ctx as state:
+        actual_tasks = set()
+        for lane in LANES:
+            actual_tasks.update(f"{lane}/{stem}" for stem in _md_stems(TASKS_DIR / lane) if stem != "README")
+        actual_tasks.update(_md_stems(OUTBOX_DIR))
+        pending = set(state['pending_tasks'])
+        missing_in_state = actual_tasks - pending
+        orphaned_in_state = pending - actual_tasks
+        print(f"Tasks in files but not in state: {len(missing_in_state)}")
+        for t in sorted(missing_in_state):
+            print(f"  + {t}")
+        print(f"Tasks in state but no file: {len(orphaned_in_state)}")
+        for t in sorted(orphaned_in_state):
+            print(f"  - {t}")
+        if fix:
+            state['pending_tasks'] = sorted(actual_tasks)
+            print("State reconciled with task files")
+
+def setup_logging():
+    """Configure file + console logging for commands that modify state.
+
+    Records go through a QueueHandler to a background QueueListener so log
+    writes don't block the command; the log file is opened on first write.
+    """
+    LOG_DIR.mkdir(exist_ok=True)
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [logging.FileHandler(LOG_DIR / "swarm.log", delay=True), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
+
+# Subcommand -> (help text, handler taking the parsed argparse namespace)
+COMMANDS = {
+    'status': ("Show swarm status", lambda args: cmd_status(verbose=args.verbose)),
+    'wave': ("Increment the wave counter", lambda args: cmd_new_wave()),
+    'tasks': ("List pending tasks in OUTBOX", lambda args: cmd_list_tasks()),
+    'results': ("List results in INBOX", lambda args: cmd_list_results()),
+    'collect': ("Collect INBOX results into state", lambda args: cmd_collect()),
+    'kill': ("Remove a task from pending_tasks", lambda args: cmd_kill(args.task_id)),
+    'reset': ("Reset swarm state to initial values", lambda args: cmd_reset()),
+    'reconcile': ("Reconcile pending_tasks with task files", lambda args: cmd_reconcile(fix=args.fix)),
+}
+
+def build_parser():
+    """Build the swarm.py argument parser."""
+    parser = argparse.ArgumentParser(prog="swarm.py", description="Zerg Rush Swarm Manager CLI")
+    subparsers = parser.add_subparsers(dest="cmd", metavar="command")
+    for name, (help_text, _) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        if name == 'status':
+            sub.add_argument('-v', '--verbose', action='store_true', help="Show task lists")
+        elif name == 'kill':
+            sub.add_argument('task_id', help="Task ID to remove")
+        elif name == 'reconcile':
+            sub.add_argument('--fix', action='store_true', help="Rewrite pending_tasks from task files")
+    return parser
+
+# Read-only commands skip logging setup entirely (no log file, no listener)
+READ_ONLY_COMMANDS = frozenset({'status', 'tasks', 'results'})
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv:
+        argv[0] = argv[0].lower()
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.cmd is None:
+        parser.print_usage()
         sys.exit(1)
+    if args.cmd not in READ_ONLY_COMMANDS:
+        setup_logging()
+    COMMANDS[args.cmd][1](args)
 
 if __name__ == "__main__":
     main()
@@ -1,8 +1,15 @@
 """Minimal benchmark harness for matrix multiplication."""
+import os
 import time
-import statistics
 from typing import Tuple, Dict, Any
 
+# Pin BLAS thread pools before numpy loads so workers aren't re-spawned
+# between runs (set these externally to override).
+_THREADS = str(os.cpu_count() or 1)
+os.environ.setdefault("OMP_NUM_THREADS", _THREADS)
+os.environ.setdefault("OPENBLAS_NUM_THREADS", _THREADS)
+os.environ.setdefault("MKL_NUM_THREADS", _THREADS)
+
 try:
     import numpy as np
     HAS_NUMPY = True
@@ -10,46 +17,72 @@ except ImportError:
     HAS_NUMPY = False
 
 
-def bench_matmul(shape: Tuple[int, int], warmup: int = 3, runs: int = 10) -> Dict[str, Any]:
+def bench_matmul(
+    shape: Tuple[int, int],
+    warmup: int = 3,
+    runs: int = 10,
+    batch: int = 8,
+    order: str = "C",
+) -> Dict[str, Any]:
     """Benchmark matmul for given shape. Returns timing stats.
 
+    Each timed run issues a single batched GEMM over a stack of ``batch``
+    matrix pairs, so Python/NumPy dispatch overhead is paid once per run
+    instead of once per multiplication. Reported timings are per matmul.
+
     Args:
         shape: Tuple of (M, N) for square matrix multiplication (M x N) @ (N x M)
         warmup: Number of warmup runs to discard
         runs: Number of timed runs
+        batch: Number of matmuls stacked into each batched call
+        order: Memory layout of each right-hand matrix, "C" (row-major) or
+            "F" (column-major), to characterize which layout BLAS prefers
 
     Returns:
-        dict with keys: mean_ms, std_ms, shape
+        dict with keys: mean_ms, std_ms, shape, order
     """
     if not HAS_NUMPY:
         raise ImportError("numpy is required for matrix multiplication benchmarks")
+    if order not in ("C", "F"):
+        raise ValueError(f"order must be 'C' or 'F', got {order!r}")
 
     m, n = shape
 
-    # Create random matrices
-    a = np.random.randn(m, n).astype(np.float32)
-    b = np.random.randn(n, m).astype(np.float32)
+    # Create stacked random matrices: (batch, M, N) @ (batch, N, M)
+    a = np.random.randn(batch, m, n).astype(np.float32)
+    if order == "F":
+        # Transposed view of a C-contiguous stack: each (N, M) slice is F-contiguous
+        b = np.random.randn(batch, m, n).astype(np.float32).transpose(0, 2, 1)
+    else:
+        b = np.random.randn(batch, n, m).astype(np.float32)
+    out = np.empty((batch, m, m), dtype=np.float32)
+
+    # Fault in every page up front so first-touch cost doesn't land in timings
+    a.sum()
+    b.sum()
+    out.fill(0.0)
 
     # Warmup runs (discard)
     for _ in range(warmup):
-        _ = np.matmul(a, b)
+        np.matmul(a, b, out=out)
 
-    # Timed runs
-    timings_ms = []
-    for _ in range(runs):
-        start = time.perf_counter()
-        _ = np.matmul(a, b)
-        end = time.perf_counter()
-        timings_ms.append((end - start) * 1000)
+    # Timed runs (raw ns, converted once after the loop)
+    timings_ns = np.empty(runs, dtype=np.int64)
+    for i in range(runs):
+        start = time.perf_counter_ns()
+        np.matmul(a, b, out=out)
+        timings_ns[i] = time.perf_counter_ns() - start
 
     # Calculate statistics
-    mean_ms = statistics.mean(timings_ms)
-    std_ms = statistics.stdev(timings_ms) if len(timings_ms) > 1 else 0.0
+    timings_ms = timings_ns / (1e6 * batch)
+    mean_ms = float(timings_ms.mean())
+    std_ms = float(timings_ms.std(ddof=1)) if timings_ms.size > 1 else 0.0
 
     result = {
         "mean_ms": mean_ms,
         "std_ms": std_ms,
         "shape": shape,
+        "order": order,
     }
 
     return result
@@ -57,7 +90,7 @@ def bench_matmul(shape: Tuple[int, int], warmup: int = 3, runs: int = 10) -> Dic
 
 def print_results(results: Dict[str, Any]) -> None:
     """Print benchmark results in a readable format."""
-    print(f"Shape: {results['shape']}")
+    print(f"Shape: {results['shape']} (b order: {results['order']})")
     print(f"  Mean: {results['mean_ms']:.4f} ms")
     print(f"  Std:  {results['std_ms']:.4f} ms")
 
@@ -66,6 +99,7 @@ if __name__ == "__main__":
     print("Matrix Multiplication Benchmark")
     print("=" * 40)
 
-    # Benchmark for shape (256, 256)
-    results = bench_matmul(shape=(256, 256))
-    print_results(results)
+    # Benchmark for shape (256, 256) with both layouts of b
+    for order in ("C", "F"):
+        results = bench_matmul(shape=(256, 256), order=order)
+        print_results(results)
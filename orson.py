@@ -17,8 +17,6 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from orson.server import main
-
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
@@ -37,4 +35,8 @@ if __name__ == "__main__":
     )
 
     args = parser.parse_args()
+
+    # Import the server stack only after argument parsing, so --help stays fast
+    from orson.server import main
+
     main(host=args.host, port=args.port)
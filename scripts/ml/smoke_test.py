@@ -4,13 +4,6 @@ import sys
 import json
 from pathlib import Path
 
-try:
-    import torch
-    import torch.nn as nn
-except ImportError:
-    print("ERROR: PyTorch not installed. Run: pip install torch")
-    sys.exit(1)
-
 
 def load_config(config_path: str = None) -> dict:
     """Load configuration from file or return defaults."""
@@ -29,27 +22,58 @@ def load_config(config_path: str = None) -> dict:
         return defaults
 
 
-class SimpleModel(nn.Module):
-    """Simple feedforward model for smoke testing."""
-    def __init__(self, input_dim: int, hidden_dim: int, output_dim: int):
-        super().__init__()
-        self.layers = nn.Sequential(
-            nn.Linear(input_dim, hidden_dim), nn.ReLU(), nn.Linear(hidden_dim, output_dim)
-        )
+def _simple_model_cls():
+    """Define SimpleModel on first use so importing this module skips torch."""
+    global _SimpleModel
+    if _SimpleModel is None:
+        import torch
+        import torch.nn as nn
+
+        class SimpleModel(nn.Module):
+            """Simple feedforward model for smoke testing."""
+            def __init__(self, input_dim: int, hidden_dim: int, output_dim: int):
+                super().__init__()
+                self.layers = nn.Sequential(
+                    nn.Linear(input_dim, hidden_dim), nn.ReLU(), nn.Linear(hidden_dim, output_dim)
+                )
+
+            def forward(self, x: torch.Tensor) -> torch.Tensor:
+                return self.layers(x)
+
+        _SimpleModel = SimpleModel
+    return _SimpleModel
+
 
-    def forward(self, x: torch.Tensor) -> torch.Tensor:
-        return self.layers(x)
+_SimpleModel = None
+
+
+def __getattr__(name):
+    if name == "SimpleModel":
+        return _simple_model_cls()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def smoke_test(config_path: str = None) -> bool:
     """Run 1 batch through model. Returns True if passes."""
+    try:
+        import torch
+    except ImportError:
+        print("ERROR: PyTorch not installed. Run: pip install torch")
+        return False
     try:
         config = load_config(config_path)
         print(f"Config: {config}")
         device = torch.device(config["device"])
         print(f"Using device: {device}")
 
-        model = SimpleModel(config["input_dim"], config["hidden_dim"], config["output_dim"]).to(device)
+        # A 1-batch smoke test gains nothing from thread pools sized to cpu_count
+        torch.set_num_threads(1)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass  # Already set, or parallel work has started in this process
+
+        model = _simple_model_cls()(config["input_dim"], config["hidden_dim"], config["output_dim"]).to(device)
         model.eval()
         print(f"Model: {type(model).__name__}")
 
@@ -57,8 +81,8 @@ def smoke_test(config_path: str = None) -> bool:
         batch = torch.randn(config["batch_size"], config["input_dim"], device=device)
         print(f"Input shape: {batch.shape}")
 
-        # Forward pass only (no backward)
-        with torch.no_grad():
+        # Forward pass only (no autograd or view tracking)
+        with torch.inference_mode():
             output = model(batch)
 
         print(f"Output shape: {output.shape}")
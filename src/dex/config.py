@@ -6,8 +6,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
 
 @dataclass
 class DexConfig:
@@ -21,10 +19,42 @@ class DexConfig:
             raise ValueError(f"Invalid network: {self.network}. Must be 'mainnet' or 'devnet'")
 
 
+def _read_config_file(config_path: Path) -> dict:
+    """Parse a config file, picking the parser from its extension.
+
+    .toml uses stdlib tomllib (the tomli backport before Python 3.11) and
+    .json uses stdlib json; anything else is treated as YAML and parsed
+    with libyaml's CSafeLoader when available.
+    """
+    suffix = config_path.suffix.lower()
+    if suffix == ".toml":
+        try:
+            import tomllib  # Python 3.11+
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ValueError(
+                    f"Reading {config_path.name} needs Python 3.11+ or the 'tomli' package"
+                ) from None
+
+        with open(config_path, "rb") as f:
+            return tomllib.load(f)
+    if suffix == ".json":
+        with open(config_path, "rb") as f:
+            return json.load(f) or {}
+
+    import yaml  # Deferred: only needed for YAML config files
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(config_path, "r") as f:
+        return yaml.load(f, Loader=loader) or {}
+
+
 def load_dex_config(path: Optional[str] = None) -> DexConfig:
-    """Load DEX config from YAML file or environment variables.
+    """Load DEX config from a YAML/TOML/JSON file or environment variables.
 
-    Priority: YAML file > env vars (RPC_URL, KEYPAIR_PATH, NETWORK).
+    Priority: config file > env vars (RPC_URL, KEYPAIR_PATH, NETWORK).
     Raises ValueError if required fields missing, FileNotFoundError if files don't exist.
     """
     config_data = {}
@@ -32,8 +62,7 @@ def load_dex_config(path: Optional[str] = None) -> DexConfig:
         config_path = Path(path)
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
-        with open(config_path, "r") as f:
-            config_data = yaml.safe_load(f) or {}
+        config_data = _read_config_file(config_path)
 
     rpc_url = config_data.get("rpc_url") or os.environ.get("RPC_URL")
     keypair_path = config_data.get("keypair_path") or os.environ.get("KEYPAIR_PATH")
@@ -70,8 +99,8 @@ def load_keypair(path: str) -> bytes:
     if len(key_data) != 64:
         raise ValueError(f"Keypair must be 64 bytes, got {len(key_data)}")
 
-    for i, val in enumerate(key_data):
-        if not isinstance(val, int) or val < 0 or val > 255:
-            raise ValueError(f"Invalid byte value at index {i}: {val}")
-
-    return bytes(key_data)  # Never log secret key
+    # bytes() range- and type-checks every element in a single C pass
+    try:
+        return bytes(key_data)  # Never log secret key
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid byte in keypair: {e}") from e
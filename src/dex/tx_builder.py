@@ -4,13 +4,27 @@ This module provides transaction building utilities for Solana DEX operations,
 with safety features including destination validation and dry-run mode.
 """
 
-from typing import Any
+import sys
+from typing import Any, Iterable
 
 from .config import DexConfig
 
 # Approved program IDs / token mints for destination validation.
 # When non-empty, only destinations in this set are allowed.
-DESTINATION_ALLOWLIST: set[str] = set()
+# Immutable; replace it via set_destination_allowlist().
+DESTINATION_ALLOWLIST: frozenset[str] = frozenset()
+
+
+def set_destination_allowlist(destinations: Iterable[str]) -> None:
+    """Replace DESTINATION_ALLOWLIST with the given destinations.
+
+    Entries are interned so repeated addresses share one string object.
+
+    Args:
+        destinations: Program IDs / token mints to allow. Empty allows all.
+    """
+    global DESTINATION_ALLOWLIST
+    DESTINATION_ALLOWLIST = frozenset(sys.intern(d) for d in destinations)
 
 
 class TxBuilder:
@@ -7,14 +7,17 @@ with YAML loading support and type validation.
 
 from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict, Optional, Type, TypeVar, get_type_hints
-import yaml
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar, get_type_hints
 
 
 T = TypeVar('T', bound='TrainConfig')
 
+# YAML loader class, resolved on first load_config() call so importing
+# this module (e.g. for TrainConfig defaults) never imports PyYAML.
+_Loader: Optional[type] = None
 
-@dataclass
+
+@dataclass(slots=True)
 class TrainConfig:
     """Configuration for ML training runs.
 
@@ -33,19 +36,31 @@ class TrainConfig:
         """Validate types after initialization."""
         self._validate_types()
 
+    @classmethod
+    def _type_spec(cls) -> Tuple[Tuple[str, type, bool], ...]:
+        """Return cached (name, expected_type, coerce_to_float) per typed field.
+
+        Resolved once per class (subclasses get their own entry) so that
+        get_type_hints/fields don't run on every instance construction.
+        """
+        spec = cls.__dict__.get("_TYPE_SPEC")
+        if spec is None:
+            hints = get_type_hints(cls)
+            spec = tuple(
+                (f.name, hints[f.name], hints[f.name] is float)
+                for f in fields(cls)
+                if hints.get(f.name) is not None
+            )
+            cls._TYPE_SPEC = spec
+        return spec
+
     def _validate_types(self) -> None:
         """Validate that all fields have correct types."""
-        hints = get_type_hints(self.__class__)
-        for field_obj in fields(self):
-            name = field_obj.name
+        for name, expected_type, coerce_float in self._type_spec():
             value = getattr(self, name)
-            expected_type = hints.get(name)
-
-            if expected_type is None:
-                continue
 
             # Handle numeric type coercion (int/float)
-            if expected_type == float and isinstance(value, int):
+            if coerce_float and isinstance(value, int):
                 setattr(self, name, float(value))
                 continue
 
@@ -65,9 +80,10 @@ class TrainConfig:
         Returns:
             TrainConfig instance.
         """
-        valid_fields = {f.name for f in fields(cls)}
-        filtered = {k: v for k, v in data.items() if k in valid_fields}
-        return cls(**filtered)
+        valid_fields = cls.__dict__.get("_VALID_FIELDS")
+        if valid_fields is None:
+            valid_fields = cls._VALID_FIELDS = frozenset(f.name for f in fields(cls))
+        return cls(**{k: v for k, v in data.items() if k in valid_fields})
 
 
 def load_config(path: Optional[str] = None) -> TrainConfig:
@@ -81,7 +97,7 @@ def load_config(path: Optional[str] = None) -> TrainConfig:
 
     Raises:
         FileNotFoundError: If path is provided but file doesn't exist.
-        yaml.YAMLError: If YAML parsing fails.
+        yaml.YAMLError: If YAML parsing fails (PyYAML is imported lazily).
         TypeError: If config values have incorrect types.
     """
     if path is None:
@@ -91,7 +107,14 @@ def load_config(path: Optional[str] = None) -> TrainConfig:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
+    global _Loader
+    import yaml
+
+    if _Loader is None:
+        # libyaml-backed loader when available, pure-Python fallback otherwise
+        _Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     with open(config_path, 'r') as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_Loader) or {}
 
     return TrainConfig.from_dict(data)
@@ -1,19 +1,106 @@
 """Metric collector for training logging and aggregation."""
 
-from collections import defaultdict
 from typing import Optional
 
+import numpy as np
+
+# Initial per-metric buffer size; buffers double until they reach history_size
+_INITIAL_CAPACITY = 64
+
+
+class _MetricSeries:
+    """Samples for one metric, stored as parallel step/value arrays.
+
+    The arrays grow geometrically up to ``maxlen`` and then act as a ring
+    buffer, overwriting the oldest sample. Running sum/count cover every
+    sample ever logged, so the mean stays exact after eviction. The sum
+    is Neumaier-compensated, matching math.fsum closely without keeping
+    the values around.
+    """
+
+    __slots__ = ("steps", "values", "maxlen", "start", "size", "count", "total", "_comp")
+
+    def __init__(self, maxlen: int):
+        capacity = min(_INITIAL_CAPACITY, maxlen)
+        self.steps = np.empty(capacity, dtype=np.int64)
+        self.values = np.empty(capacity, dtype=np.float64)
+        self.maxlen = maxlen
+        self.start = 0  # Index of the oldest retained sample
+        self.size = 0  # Number of retained samples
+        self.count = 0
+        self.total = 0.0
+        self._comp = 0.0  # Low-order bits lost from total
+
+    def append(self, step: int, value: float) -> None:
+        capacity = len(self.values)
+        if self.size < capacity:
+            i = self.size
+            self.size += 1
+        elif capacity < self.maxlen:
+            # Not yet wrapped (start == 0), so growing keeps samples in order
+            new_capacity = min(capacity * 2, self.maxlen)
+            steps = np.empty(new_capacity, dtype=np.int64)
+            values = np.empty(new_capacity, dtype=np.float64)
+            steps[:capacity] = self.steps
+            values[:capacity] = self.values
+            self.steps, self.values = steps, values
+            i = self.size
+            self.size += 1
+        else:
+            i = self.start
+            self.start = (self.start + 1) % capacity
+        self.steps[i] = step
+        self.values[i] = value
+        self.count += 1
+        total = self.total + value
+        if abs(self.total) >= abs(value):
+            self._comp += (self.total - total) + value
+        else:
+            self._comp += (value - total) + self.total
+        self.total = total
+
+    def mean(self) -> float:
+        return (self.total + self._comp) / self.count
+
+    def _ordered(self, arr: np.ndarray) -> np.ndarray:
+        """Retained samples from oldest to newest."""
+        if self.start == 0:
+            return arr[:self.size]
+        return np.concatenate((arr[self.start:], arr[:self.start]))
+
+    def latest(self) -> tuple[int, float]:
+        i = (self.start + self.size - 1) % len(self.values)
+        return int(self.steps[i]), float(self.values[i])
+
+    def to_tuples(self) -> list[tuple[int, float]]:
+        return list(zip(self._ordered(self.steps).tolist(), self._ordered(self.values).tolist()))
+
 
 class MetricCollector:
     """Collects and aggregates training metrics.
 
     Simple metric collection with running statistics.
+    Samples are stored as NumPy arrays (structure-of-arrays) rather than
+    per-sample tuples, and only the most recent ``history_size`` samples
+    per metric are retained; summaries still cover every logged value.
     Not thread-safe (designed for single-process use).
     """
 
-    def __init__(self):
-        """Initialize the metric collector."""
-        self.metrics: dict[str, list[tuple[int, float]]] = defaultdict(list)
+    def __init__(self, history_size: int = 10_000):
+        """Initialize the metric collector.
+
+        Args:
+            history_size: Max samples retained per metric for get_values().
+        """
+        if history_size < 1:
+            raise ValueError(f"history_size must be >= 1, got {history_size}")
+        self.history_size = history_size
+        self._series: dict[str, _MetricSeries] = {}
+
+    @property
+    def metrics(self) -> dict[str, list[tuple[int, float]]]:
+        """Snapshot of all metrics as (step, value) tuples (materialized per call)."""
+        return {name: series.to_tuples() for name, series in self._series.items()}
 
     def log(self, name: str, value: float, step: int) -> None:
         """Log a metric value at a given step.
@@ -23,7 +110,10 @@ class MetricCollector:
             value: The metric value to log
             step: Training step number
         """
-        self.metrics[name].append((step, value))
+        series = self._series.get(name)
+        if series is None:
+            series = self._series[name] = _MetricSeries(self.history_size)
+        series.append(step, value)
 
     def get_summary(self) -> dict[str, float]:
         """Return mean of each metric.
@@ -31,12 +121,7 @@ class MetricCollector:
         Returns:
             Dictionary mapping metric names to their mean values.
         """
-        summary = {}
-        for name, values in self.metrics.items():
-            if values:
-                mean_val = sum(v for _, v in values) / len(values)
-                summary[name] = mean_val
-        return summary
+        return {name: s.mean() for name, s in self._series.items() if s.count}
 
     def get_latest(self, name: str) -> Optional[tuple[int, float]]:
         """Get the most recent value for a metric.
@@ -47,20 +132,22 @@ class MetricCollector:
         Returns:
             Tuple of (step, value) or None if no values logged.
         """
-        if name in self.metrics and self.metrics[name]:
-            return self.metrics[name][-1]
+        series = self._series.get(name)
+        if series is not None and series.count:
+            return series.latest()
         return None
 
     def get_values(self, name: str) -> list[tuple[int, float]]:
-        """Get all values for a metric.
+        """Get retained values for a metric.
 
         Args:
             name: Name of the metric
 
         Returns:
-            List of (step, value) tuples.
+            List of (step, value) tuples, oldest first (at most history_size).
         """
-        return list(self.metrics.get(name, []))
+        series = self._series.get(name)
+        return series.to_tuples() if series is not None else []
 
     def clear(self, name: Optional[str] = None) -> None:
         """Clear metrics.
@@ -69,10 +156,9 @@ class MetricCollector:
             name: If provided, clear only this metric. Otherwise clear all.
         """
         if name is not None:
-            if name in self.metrics:
-                self.metrics[name].clear()
+            self._series.pop(name, None)
         else:
-            self.metrics.clear()
+            self._series.clear()
 
     def print_summary(self) -> None:
         """Print a formatted summary of all metrics."""
@@ -85,15 +171,15 @@ class MetricCollector:
         print("Metric Summary")
         print("=" * 40)
         for name, mean_val in sorted(summary.items()):
-            count = len(self.metrics[name])
+            count = self._series[name].count
             print(f"  {name}: {mean_val:.4f} (n={count})")
         print("=" * 40)
 
     def __len__(self) -> int:
         """Return total number of logged values across all metrics."""
-        return sum(len(v) for v in self.metrics.values())
+        return sum(s.count for s in self._series.values())
 
     def __repr__(self) -> str:
         """Return string representation."""
-        metric_names = list(self.metrics.keys())
+        metric_names = list(self._series.keys())
         return f"MetricCollector(metrics={metric_names}, total_values={len(self)})"
@@ -9,22 +9,41 @@ Usage:
 import sys
 
 
+def _cli():
+    from .cli import main as cli_main
+    cli_main()
+
+
+def _server():
+    from .server import main as server_main
+    server_main()
+
+
+def _help():
+    print(__doc__)
+
+
+# Subcommand -> handler; each handler imports its own stack on demand
+_COMMANDS = {
+    "cli": _cli,
+    "server": _server,
+    "-h": _help,
+    "--help": _help,
+}
+
+
 def main():
     """Main entry point with subcommand support."""
-    args = sys.argv[1:]
-
-    if not args or args[0] == "cli":
-        from .cli import main as cli_main
-        cli_main()
-    elif args[0] == "server":
-        from .server import main as server_main
-        server_main()
-    elif args[0] in ("-h", "--help"):
-        print(__doc__)
-    else:
-        print(f"Unknown command: {args[0]}")
+    if len(sys.argv) < 2:
+        _cli()
+        return
+
+    handler = _COMMANDS.get(sys.argv[1])
+    if handler is None:
+        print(f"Unknown command: {sys.argv[1]}")
         print("Use 'cli' or 'server'")
         sys.exit(1)
+    handler()
 
 
 if __name__ == "__main__":
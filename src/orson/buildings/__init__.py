@@ -1,23 +1,54 @@
-"""Orson Buildings Module - New town buildings."""
-
-from .museum import MuseumState, render_museum, load_museum_data, refresh_museum_concepts, load_concept_memories
-from .apartments import ApartmentsState, render_apartments, spawn_worker_from_pool, return_worker_to_pool
-from .school import SchoolState, render_school, load_prompts, refresh_school_knowledge, fetch_lane_knowledge_sync
-from .mcdonalds import McDonaldsState, render_mcdonalds, create_quick_task
-from .newspaper import (
-    NewspaperState, render_newspaper, scan_for_changes, queue_for_research,
-    store_to_rag, process_queue, process_file_to_rag, init_default_watches, RAGFinding
-)
-from .brain import BrainPanelState, render_brain_panel, render_brain_status_indicator
-from .daemons import DaemonConfig, DaemonPanelState, render_daemons_panel, get_daemon_summary
-
-__all__ = [
-    'MuseumState', 'render_museum', 'load_museum_data', 'refresh_museum_concepts', 'load_concept_memories',
-    'ApartmentsState', 'render_apartments', 'spawn_worker_from_pool', 'return_worker_to_pool',
-    'SchoolState', 'render_school', 'load_prompts', 'refresh_school_knowledge', 'fetch_lane_knowledge_sync',
-    'McDonaldsState', 'render_mcdonalds', 'create_quick_task',
-    'NewspaperState', 'render_newspaper', 'scan_for_changes', 'queue_for_research',
-    'store_to_rag', 'process_queue', 'process_file_to_rag', 'init_default_watches', 'RAGFinding',
-    'BrainPanelState', 'render_brain_panel', 'render_brain_status_indicator',
-    'DaemonConfig', 'DaemonPanelState', 'render_daemons_panel', 'get_daemon_summary',
-]
+"""Orson Buildings Module - New town buildings.
+
+Submodules are imported on first attribute access (PEP 562), so
+``import orson.buildings`` doesn't pull in Rich and the RAG/IO stack
+until a building is actually used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .museum import MuseumState, render_museum, load_museum_data, refresh_museum_concepts, load_concept_memories
+    from .apartments import ApartmentsState, render_apartments, spawn_worker_from_pool, return_worker_to_pool
+    from .school import SchoolState, render_school, load_prompts, refresh_school_knowledge, fetch_lane_knowledge_sync
+    from .mcdonalds import McDonaldsState, render_mcdonalds, create_quick_task
+    from .newspaper import (
+        NewspaperState, render_newspaper, scan_for_changes, queue_for_research,
+        store_to_rag, process_queue, process_file_to_rag, init_default_watches, RAGFinding,
+        start_watching, stop_watching, set_chunk_cache_dir, clear_chunk_cache
+    )
+    from .brain import BrainPanelState, render_brain_panel, render_brain_status_indicator
+    from .daemons import DaemonConfig, DaemonPanelState, render_daemons_panel, get_daemon_summary
+
+_SUBMODULE_EXPORTS = {
+    'museum': ('MuseumState', 'render_museum', 'load_museum_data', 'refresh_museum_concepts', 'load_concept_memories'),
+    'apartments': ('ApartmentsState', 'render_apartments', 'spawn_worker_from_pool', 'return_worker_to_pool'),
+    'school': ('SchoolState', 'render_school', 'load_prompts', 'refresh_school_knowledge', 'fetch_lane_knowledge_sync'),
+    'mcdonalds': ('McDonaldsState', 'render_mcdonalds', 'create_quick_task'),
+    'newspaper': (
+        'NewspaperState', 'render_newspaper', 'scan_for_changes', 'queue_for_research',
+        'store_to_rag', 'process_queue', 'process_file_to_rag', 'init_default_watches', 'RAGFinding',
+        'start_watching', 'stop_watching', 'set_chunk_cache_dir', 'clear_chunk_cache',
+    ),
+    'brain': ('BrainPanelState', 'render_brain_panel', 'render_brain_status_indicator'),
+    'daemons': ('DaemonConfig', 'DaemonPanelState', 'render_daemons_panel', 'get_daemon_summary'),
+}
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,78 @@
+"""Small caches for the buildings: rendered panels and RAG fetches."""
+
+import asyncio
+import functools
+import time
+from typing import Any, Dict, Hashable, Optional
+
+
+class PanelCache:
+    """Maps a state fingerprint to the Panel rendered from it.
+
+    Holds at most ``maxsize`` entries and evicts the oldest insert first.
+    Fingerprints must capture everything the renderer reads.
+    """
+
+    __slots__ = ("maxsize", "_entries")
+
+    def __init__(self, maxsize: int = 8):
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Any] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        return self._entries.get(key)
+
+    def put(self, key: Hashable, panel: Any) -> Any:
+        if len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = panel
+        return panel
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def ttl_cache_swr(ttl: float = 30.0, stale_ttl: float = 300.0):
+    """Cache an async function's results with stale-while-revalidate.
+
+    Results younger than ``ttl`` seconds are returned as-is. Between
+    ``ttl`` and ``stale_ttl`` the cached value is returned immediately and
+    a refresh is scheduled on the running loop (one per key at a time).
+    Older entries go through a normal call. Empty results aren't cached.
+    Arguments must be hashable; the wrapper exposes ``cache_clear()``.
+    """
+    def decorator(fn):
+        cache: Dict[Hashable, tuple] = {}  # key -> (value, fetched_at)
+        refreshing: Dict[Hashable, asyncio.Task] = {}
+
+        async def fetch(key, args, kwargs):
+            value = await fn(*args, **kwargs)
+            if value:  # Empty results (e.g. RAG offline) are not cached
+                cache[key] = (value, time.monotonic())
+            return value
+
+        def refresh_done(key, task):
+            refreshing.pop(key, None)
+            if not task.cancelled():
+                task.exception()  # Keep the stale value; mark error as retrieved
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            entry = cache.get(key)
+            if entry is not None:
+                value, fetched_at = entry
+                age = time.monotonic() - fetched_at
+                if age < ttl:
+                    return value
+                if age < stale_ttl:
+                    if key not in refreshing:
+                        task = asyncio.create_task(fetch(key, args, kwargs))
+                        refreshing[key] = task
+                        task.add_done_callback(functools.partial(refresh_done, key))
+                    return value
+            return await fetch(key, args, kwargs)
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
@@ -0,0 +1,34 @@
+"""RAG memory normalization shared by the building panels."""
+
+from typing import Any, NamedTuple
+
+
+class NormalizedMemory(NamedTuple):
+    """A recalled memory reduced to what the panels display."""
+    content: str
+    quality: float
+    q_icon: str
+
+
+def quality_icon(quality: float) -> str:
+    """Green/yellow/red indicator for a memory quality score."""
+    if quality >= 0.7:
+        return "\U0001f7e2"
+    if quality >= 0.4:
+        return "\U0001f7e1"
+    return "\U0001f534"
+
+
+def normalize_memory(memory: Any) -> NormalizedMemory:
+    """Convert a raw recall result (dict or anything else) to a NormalizedMemory.
+
+    Already-normalized memories are returned unchanged.
+    """
+    if type(memory) is NormalizedMemory:
+        return memory
+    if isinstance(memory, dict):
+        content = memory.get("content", memory.get("text", str(memory)))
+        quality = memory.get("quality", 0.5)
+    else:
+        content, quality = str(memory), 0.5
+    return NormalizedMemory(content, quality, quality_icon(quality))
@@ -0,0 +1,6 @@
+"""Text helpers shared by the building panels."""
+
+
+def truncate(s: str, n: int) -> str:
+    """Cut s to at most n characters, ending in '...' when shortened."""
+    return s if len(s) <= n else f"{s[:n - 3]}..."
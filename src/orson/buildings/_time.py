@@ -0,0 +1,29 @@
+"""Relative time formatting shared by the building panels."""
+
+from bisect import bisect_right
+from datetime import datetime
+from typing import Optional
+
+# Upper bounds (exclusive, in seconds) for each unit below; past the last
+# threshold everything is shown in days.
+_THRESHOLDS = (60, 3600, 86400)
+_UNITS = ((1, "s ago"), (60, "m ago"), (3600, "h ago"), (86400, "d ago"))
+
+
+def format_time_ago(
+    dt: Optional[datetime],
+    now: Optional[datetime] = None,
+    just_now: bool = False,
+) -> str:
+    """Format a datetime as 'Xs/m/h/d ago', relative to now (default: current time).
+
+    With just_now=True, anything under a minute reads "just now".
+    """
+    if not dt:
+        return "never"
+    seconds = int(((now or datetime.now()) - dt).total_seconds())
+    i = bisect_right(_THRESHOLDS, seconds)
+    if i == 0 and just_now:
+        return "just now"
+    divisor, suffix = _UNITS[i]
+    return f"{seconds // divisor}{suffix}"
@@ -5,17 +5,20 @@ Tracks idle workers waiting for assignment.
 "Every zergling needs a home between shifts."
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+from itertools import islice
+from typing import TYPE_CHECKING, Deque, Dict, Optional
+
+if TYPE_CHECKING:
+    from rich.panel import Panel
 
 APARTMENTS_ICON = "\U0001f3e2"  # Office building emoji
+_TITLE = f"{APARTMENTS_ICON} APARTMENTS - Agent Pool"
 
 
-@dataclass
+@dataclass(slots=True)
 class IdleWorker:
     """A worker waiting in the pool."""
     name: str
@@ -25,24 +28,36 @@ class IdleWorker:
     tasks_completed: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ApartmentsState:
     """State for the apartments building."""
-    idle_workers: List[IdleWorker] = field(default_factory=list)
+    idle_workers: Deque[IdleWorker] = field(default_factory=deque)  # FIFO: popleft to assign
     capacity: int = 10  # Max workers in pool
     total_spawned: int = 0
+    # name -> worker index over idle_workers; kept in sync by the pool helpers
+    _by_name: Dict[str, IdleWorker] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not isinstance(self.idle_workers, deque):
+            self.idle_workers = deque(self.idle_workers)
+        self._by_name = {w.name: w for w in self.idle_workers}
 
 
-def render_apartments(state: ApartmentsState) -> Panel:
+def render_apartments(state: ApartmentsState) -> "Panel":
     """Render the apartments panel showing idle workers."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table(show_header=True, header_style="bold")
     table.add_column("Name", width=12)
     table.add_column("Last Task", width=10)
     table.add_column("Completed", width=8)
     table.add_column("Idle", width=8)
 
-    for worker in state.idle_workers[:8]:
-        idle_mins = (datetime.now() - worker.idle_since).seconds // 60
+    now = datetime.now()
+    for worker in islice(state.idle_workers, 8):
+        idle_mins = int((now - worker.idle_since).total_seconds()) // 60
         table.add_row(
             worker.name,
             worker.last_task or "-",
@@ -55,7 +70,7 @@ def render_apartments(state: ApartmentsState) -> Panel:
 
     return Panel(
         table,
-        title=f"{APARTMENTS_ICON} APARTMENTS - Agent Pool",
+        title=_TITLE,
         subtitle=f"{len(state.idle_workers)} idle",
         border_style="blue"
     )
@@ -64,23 +79,39 @@ def render_apartments(state: ApartmentsState) -> Panel:
 def spawn_worker_from_pool(state: ApartmentsState) -> Optional[IdleWorker]:
     """Remove and return a worker from the pool."""
     if state.idle_workers:
-        return state.idle_workers.pop(0)
+        worker = state.idle_workers.popleft()
+        state._by_name.pop(worker.name, None)
+        return worker
     return None
 
 
+def has_idle_worker(state: ApartmentsState, name: str) -> bool:
+    """Whether a worker with this name is waiting in the pool."""
+    return name in state._by_name
+
+
+def add_worker_to_pool(state: ApartmentsState, worker: IdleWorker) -> bool:
+    """Add a worker to the pool, replacing any idle entry with the same name.
+
+    Returns False if the pool is at capacity.
+    """
+    existing = state._by_name.pop(worker.name, None)
+    if existing is not None:
+        state.idle_workers.remove(existing)
+    if len(state.idle_workers) >= state.capacity:
+        return False
+    state.idle_workers.append(worker)
+    state._by_name[worker.name] = worker
+    return True
+
+
 def return_worker_to_pool(state: ApartmentsState, name: str, task_id: str, lane: str):
     """Return a completed worker to the pool."""
-    # Find existing worker to increment tasks_completed
-    existing_count = 0
-    for w in state.idle_workers:
-        if w.name == name:
-            existing_count = w.tasks_completed
-
+    existing = state._by_name.get(name)
     worker = IdleWorker(
         name=name,
         last_task=task_id,
         last_lane=lane,
-        tasks_completed=existing_count + 1
+        tasks_completed=(existing.tasks_completed if existing else 0) + 1
     )
-    if len(state.idle_workers) < state.capacity:
-        state.idle_workers.append(worker)
+    add_worker_to_pool(state, worker)
@@ -6,14 +6,33 @@ Shows memory tiers, model info, and top concepts from RAG Brain.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from rich.panel import Panel
-from rich.text import Text
-from rich.table import Table
+from ._time import format_time_ago
 
+if TYPE_CHECKING:
+    from rich.panel import Panel
+    from rich.text import Text
 
-@dataclass
+
+# Memory tier rows: (stats key, tree prefix, count style, trailing text)
+_TIER_ROWS = (
+    ("core", "\u251c\u2500\u2500 Core:       ", "bold green", " memories\n"),
+    ("active", "\u251c\u2500\u2500 Active:     ", "bold yellow", " memories\n"),
+    ("archive", "\u251c\u2500\u2500 Archive:    ", "bold blue", " memories\n"),
+    ("quarantine", "\u2514\u2500\u2500 Quarantine: ", "bold red", " memories\n\n"),
+)
+
+
+# Panel title and border style, keyed by connection status
+_TITLES = {
+    True: "\U0001f9e0 ORSON TOWN MEMORY                          STATUS: \u2705 ONLINE",
+    False: "\U0001f9e0 ORSON TOWN MEMORY                          STATUS: \u274c OFFLINE",
+}
+_BORDER_STYLES = {True: "magenta", False: "red"}
+
+
+@dataclass(slots=True)
 class BrainPanelState:
     """State for the brain panel."""
     visible: bool = False
@@ -22,27 +41,13 @@ class BrainPanelState:
     concepts: list = field(default_factory=list)
     last_refresh: Optional[datetime] = None
     error: Optional[str] = None
+    # Last rendered panel and the inputs it was built from. Callers replace
+    # stats/concepts wholesale on refresh, so identity/equality is a safe key.
+    _cache_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _cache: Optional["Panel"] = field(default=None, init=False, repr=False, compare=False)
 
 
-def format_time_ago(dt: Optional[datetime]) -> str:
-    """Format a datetime as time ago string."""
-    if not dt:
-        return "never"
-    delta = datetime.now() - dt
-    if delta.total_seconds() < 60:
-        return "just now"
-    elif delta.total_seconds() < 3600:
-        mins = int(delta.total_seconds() / 60)
-        return f"{mins}m ago"
-    elif delta.total_seconds() < 86400:
-        hours = int(delta.total_seconds() / 3600)
-        return f"{hours}h ago"
-    else:
-        days = int(delta.total_seconds() / 86400)
-        return f"{days}d ago"
-
-
-def render_brain_panel(state: BrainPanelState) -> Panel:
+def render_brain_panel(state: BrainPanelState) -> "Panel":
     """
     Render the RAG Brain status panel.
 
@@ -52,11 +57,32 @@ def render_brain_panel(state: BrainPanelState) -> Panel:
     Returns:
         Rich Panel with brain status display
     """
-    content = Text()
+    from rich.panel import Panel
+    from rich.text import Text
 
-    # Status indicator
-    status_icon = "\u2705" if state.connected else "\u274c"
-    status_text = "ONLINE" if state.connected else "OFFLINE"
+    now = datetime.now()
+    stats = state.stats or {}
+
+    # Only the relative times change between data refreshes; fold the
+    # formatted strings into the key so the panel re-renders when they tick.
+    model_info = stats.get("model", {})
+    last_trained = model_info.get("last_trained")
+    if last_trained:
+        try:
+            trained_dt = datetime.fromisoformat(last_trained)
+            trained_ago = format_time_ago(trained_dt, now, just_now=True)
+        except (ValueError, TypeError):
+            trained_ago = str(last_trained)
+    else:
+        trained_ago = "never"
+    refresh_ago = format_time_ago(state.last_refresh, now, just_now=True) if state.last_refresh else None
+
+    concepts = state.concepts[:5] if state.concepts else []
+    cache_key = (state.connected, state.error, stats, tuple(concepts), trained_ago, refresh_ago)
+    if state._cache is not None and state._cache_key == cache_key:
+        return state._cache
+
+    content = Text()
 
     if state.error:
         content.append(f"Error: {state.error}\n\n", style="red")
@@ -64,47 +90,20 @@ def render_brain_panel(state: BrainPanelState) -> Panel:
     # Memory tiers section
     content.append("MEMORY TIERS:\n", style="bold cyan")
 
-    stats = state.stats or {}
     tiers = stats.get("tiers", {})
 
-    # Default tier counts if not available
-    core = tiers.get("core", 0)
-    active = tiers.get("active", 0)
-    archive = tiers.get("archive", 0)
-    quarantine = tiers.get("quarantine", 0)
-    total = stats.get("total_memories", core + active + archive + quarantine)
-
-    content.append("\u251c\u2500\u2500 Core:       ", style="dim")
-    content.append(f"{core:,}", style="bold green")
-    content.append(" memories\n")
-
-    content.append("\u251c\u2500\u2500 Active:     ", style="dim")
-    content.append(f"{active:,}", style="bold yellow")
-    content.append(" memories\n")
-
-    content.append("\u251c\u2500\u2500 Archive:    ", style="dim")
-    content.append(f"{archive:,}", style="bold blue")
-    content.append(" memories\n")
-
-    content.append("\u2514\u2500\u2500 Quarantine: ", style="dim")
-    content.append(f"{quarantine:,}", style="bold red")
-    content.append(" memories\n\n")
+    # Only the count varies per render; prefix and styles are precomputed
+    for key, prefix, count_style, suffix in _TIER_ROWS:
+        content.append_tokens((
+            (prefix, "dim"),
+            (f"{tiers.get(key, 0):,}", count_style),
+            (suffix, None),
+        ))
 
     # Model info
-    model_info = stats.get("model", {})
     model_version = model_info.get("version", "v1")
-    last_trained = model_info.get("last_trained")
     f1_score = model_info.get("f1", 0.0)
 
-    if last_trained:
-        try:
-            trained_dt = datetime.fromisoformat(last_trained)
-            trained_ago = format_time_ago(trained_dt)
-        except (ValueError, TypeError):
-            trained_ago = str(last_trained)
-    else:
-        trained_ago = "never"
-
     content.append(f"MODEL: {model_version}", style="cyan")
     content.append(f" \u2502 Last trained: {trained_ago}", style="dim")
     content.append(f" \u2502 F1: {f1_score:.3f}\n\n", style="dim")
@@ -112,7 +111,6 @@ def render_brain_panel(state: BrainPanelState) -> Panel:
     # Top concepts
     content.append("TOP CONCEPTS:\n", style="bold cyan")
 
-    concepts = state.concepts[:5] if state.concepts else []
     if concepts:
         for i, concept in enumerate(concepts):
             if isinstance(concept, dict):
@@ -143,21 +141,23 @@ def render_brain_panel(state: BrainPanelState) -> Panel:
     content.append(" \u25c4\u2500\u2500", style="dim")
 
     # Last refresh time
-    if state.last_refresh:
-        refresh_text = f"\nLast refresh: {format_time_ago(state.last_refresh)}"
-        content.append(refresh_text, style="dim italic")
+    if refresh_ago:
+        content.append(f"\nLast refresh: {refresh_ago}", style="dim italic")
 
-    return Panel(
+    panel = Panel(
         content,
-        title=f"\U0001f9e0 ORSON TOWN MEMORY                          STATUS: {status_icon} {status_text}",
+        title=_TITLES[bool(state.connected)],
         title_align="left",
-        border_style="magenta" if state.connected else "red",
+        border_style=_BORDER_STYLES[bool(state.connected)],
         width=70,
         height=20,
     )
+    state._cache_key = cache_key
+    state._cache = panel
+    return panel
 
 
-def render_brain_status_indicator(connected: bool, stats: dict = None) -> Text:
+def render_brain_status_indicator(connected: bool, stats: dict = None) -> "Text":
     """
     Render a compact RAG status indicator for the header.
 
@@ -168,6 +168,8 @@ def render_brain_status_indicator(connected: bool, stats: dict = None) -> Text:
     Returns:
         Rich Text with status indicator
     """
+    from rich.text import Text
+
     text = Text()
     text.append("RAG: ", style="dim")
 
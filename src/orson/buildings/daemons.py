@@ -12,15 +12,18 @@ Control panel for all background processes:
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Any
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+from typing import TYPE_CHECKING, Optional, List, Any
+
+from ._time import format_time_ago
+
+if TYPE_CHECKING:
+    from rich.panel import Panel
 
 DAEMONS_ICON = "\u2699\ufe0f"  # Gear emoji
+_TITLE = f"{DAEMONS_ICON} ORSON SERVICES"
 
 
-@dataclass
+@dataclass(slots=True)
 class DaemonConfig:
     """Configuration for daemon auto-start and settings."""
     researcher_autostart: bool = True
@@ -32,7 +35,7 @@ class DaemonConfig:
     teacher_memories_per_lesson: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class DaemonPanelState:
     """State for the daemon control panel."""
     is_visible: bool = False
@@ -44,24 +47,6 @@ class DaemonPanelState:
     teacher_lessons_taught: int = 0
 
 
-def format_time_ago(dt: Optional[datetime]) -> str:
-    """Format a datetime as 'Xm ago' or 'Xs ago'."""
-    if not dt:
-        return "never"
-
-    delta = datetime.now() - dt
-    seconds = int(delta.total_seconds())
-
-    if seconds < 60:
-        return f"{seconds}s ago"
-    elif seconds < 3600:
-        return f"{seconds // 60}m ago"
-    elif seconds < 86400:
-        return f"{seconds // 3600}h ago"
-    else:
-        return f"{seconds // 86400}d ago"
-
-
 def render_daemons_panel(
     state: DaemonPanelState,
     researcher_daemon: Any = None,
@@ -70,7 +55,7 @@ def render_daemons_panel(
     rag_stats: dict = None,
     mcp_connected: bool = False,
     wave: int = 0
-) -> Panel:
+) -> "Panel":
     """
     Render the daemon control panel.
 
@@ -86,10 +71,15 @@ def render_daemons_panel(
     Returns:
         Rich Panel with daemon status
     """
-    content = Text()
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    now = datetime.now()
 
     # === DAEMON STATUS TABLE ===
-    content.append("DAEMON STATUS:\n", style="bold cyan")
+    header = Text("DAEMON STATUS:", style="bold cyan")
 
     status_table = Table(box=None, show_header=True, padding=(0, 1))
     status_table.add_column("Service", style="white")
@@ -120,7 +110,7 @@ def render_daemons_panel(
     teacher_activity = "idle"
     if teacher_daemon and teacher_running:
         if teacher_daemon.last_teach_time:
-            teacher_activity = f"Taught {format_time_ago(teacher_daemon.last_teach_time)}"
+            teacher_activity = f"Taught {format_time_ago(teacher_daemon.last_teach_time, now)}"
         else:
             teacher_activity = "Waiting..."
 
@@ -153,15 +143,8 @@ def render_daemons_panel(
         mcp_activity
     )
 
-    # Render table to text
-    from io import StringIO
-    from rich.console import Console
-    buf = StringIO()
-    temp_console = Console(file=buf, force_terminal=True, width=60)
-    temp_console.print(status_table)
-    content.append(buf.getvalue())
-
-    content.append("\n")
+    # Table is composed directly into the panel body via Group below
+    content = Text("\n")
 
     # === RESEARCHER CONFIG ===
     content.append("RESEARCHER CONFIG:\n", style="bold yellow")
@@ -188,7 +171,7 @@ def render_daemons_panel(
     if teacher_daemon:
         interval = int(teacher_daemon.lesson_interval / 60)
         lessons = teacher_daemon.lessons_taught
-        last_time = format_time_ago(teacher_daemon.last_teach_time) if teacher_daemon.last_teach_time else "never"
+        last_time = format_time_ago(teacher_daemon.last_teach_time, now) if teacher_daemon.last_teach_time else "never"
 
         content.append(f"\u251c\u2500\u2500 Lesson interval: {interval} minutes\n", style="dim")
         content.append(f"\u251c\u2500\u2500 Lessons taught: {lessons}\n", style="dim")
@@ -203,8 +186,8 @@ def render_daemons_panel(
     content.append("                                            [ESC] Close", style="dim")
 
     return Panel(
-        content,
-        title=f"{DAEMONS_ICON} ORSON SERVICES",
+        Group(header, status_table, content),
+        title=_TITLE,
         subtitle="Background Processes",
         border_style="blue"
     )
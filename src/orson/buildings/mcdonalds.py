@@ -5,17 +5,28 @@ Fast food for fast tasks. Bypass the wave system.
 "Over 1 billion tasks served."
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+from itertools import islice
+from typing import TYPE_CHECKING, Deque, Optional
+
+if TYPE_CHECKING:
+    from rich.panel import Panel
 
 MCDONALDS_ICON = "\U0001f35f"  # French fries emoji
+HISTORY_SIZE = 256  # Completed tasks kept in McDonaldsState.history
+
+_TITLE = f"{MCDONALDS_ICON} McDONALD'S - Quick Tasks"
+_STATUS_ICONS = {
+    "pending": "\u23f3",
+    "running": "\U0001f504",
+    "done": "\u2705",
+    "failed": "\u274c"
+}
 
 
-@dataclass
+@dataclass(slots=True)
 class QuickTask:
     """A quick task bypassing wave system."""
     description: str
@@ -26,18 +37,21 @@ class QuickTask:
     result: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class McDonaldsState:
     """State for quick task queue."""
-    queue: List[QuickTask] = field(default_factory=list)
-    history: List[QuickTask] = field(default_factory=list)
+    queue: Deque[QuickTask] = field(default_factory=deque)
+    history: Deque[QuickTask] = field(default_factory=lambda: deque(maxlen=HISTORY_SIZE))
     is_visible: bool = False
     input_mode: bool = False
     current_input: str = ""
 
 
-def render_mcdonalds(state: McDonaldsState) -> Panel:
+def render_mcdonalds(state: McDonaldsState) -> "Panel":
     """Render McDonald's quick task panel."""
+    from rich.panel import Panel
+    from rich.text import Text
+
     content = Text()
 
     content.append("\U0001f354 QUICK TASK MENU\n\n", style="bold yellow")
@@ -46,24 +60,20 @@ def render_mcdonalds(state: McDonaldsState) -> Panel:
 
     if state.queue:
         content.append("\U0001f4cb QUEUE:\n", style="cyan")
-        for i, task in enumerate(state.queue[:5], 1):
-            status_icon = {
-                "pending": "\u23f3",
-                "running": "\U0001f504",
-                "done": "\u2705",
-                "failed": "\u274c"
-            }.get(task.status, "?")
+        for i, task in enumerate(islice(state.queue, 5), 1):
+            status_icon = _STATUS_ICONS.get(task.status, "?")
             content.append(f"  {i}. {status_icon} ", style="white")
             content.append(f"{task.description[:30]}\n", style="dim")
 
     if state.history:
         content.append("\n\U0001f4dc RECENT:\n", style="green")
-        for task in state.history[-3:]:
+        # Walk back from the newest entry so cost doesn't grow with history
+        for task in reversed(list(islice(reversed(state.history), 3))):
             content.append(f"  \u2705 {task.description[:30]}\n", style="dim")
 
     return Panel(
         content,
-        title=f"{MCDONALDS_ICON} McDONALD'S - Quick Tasks",
+        title=_TITLE,
         subtitle="Over 1B served",
         border_style="red"
     )
@@ -5,25 +5,50 @@ Displays wave history, worker statistics, and emerged concepts from RAG Brain.
 "In Orson, we remember our own."
 """
 
-import asyncio
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Dict, Optional
 from pathlib import Path
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 from rich.columns import Columns
 
+from ..event_loop import get_loop
+from ._cache import PanelCache, ttl_cache_swr
+from ._memory import NormalizedMemory, normalize_memory
+from ._text import truncate
+
 # Icons
 MUSEUM_ICON = "\U0001f3db\ufe0f"  # Classical building
 TAG_ICON = "\U0001f3f7\ufe0f"  # Label/tag
 BRAIN_ICON = "\U0001f9e0"  # Brain
 
+_render_cache = PanelCache(maxsize=8)
+
+_STATUS_STYLES = {"DONE": "green", "PARTIAL": "magenta", "BLOCKED": "red"}
+_MUSEUM_FOOTER = (
+    ("\n", None),
+    ("[UP/DOWN]", "bold cyan"),
+    ("=Select  ", "dim"),
+    ("[ENTER]", "bold cyan"),
+    ("=View  ", "dim"),
+    ("[R]", "bold cyan"),
+    ("=Refresh  ", "dim"),
+    ("[ESC]", "bold yellow"),
+    ("=Close", "dim"),
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class WaveHistory:
     """Record of a completed wave."""
     wave_num: int
@@ -35,25 +60,29 @@ class WaveHistory:
     total_lines: int
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerStats:
     """Aggregate worker statistics."""
     total_spawned: int = 0
     total_completed: int = 0
-    by_status: Dict[str, int] = field(default_factory=dict)
-    by_lane: Dict[str, int] = field(default_factory=dict)
+    by_status: Dict[str, int] = field(default_factory=Counter)
+    by_lane: Dict[str, int] = field(default_factory=Counter)
     total_lines_written: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Concept:
     """A concept cluster from RAG Brain."""
     name: str
     memory_count: int
     sample_text: str = ""  # Sample memory text for preview
+    display_sample: str = field(default="", init=False, repr=False)  # Truncated for the museum list
+
+    def __post_init__(self):
+        self.display_sample = truncate(self.sample_text, 38)
 
 
-@dataclass
+@dataclass(slots=True)
 class MuseumState:
     """State for the museum display."""
     wave_history: List[WaveHistory] = field(default_factory=list)
@@ -64,7 +93,7 @@ class MuseumState:
     rag_connected: bool = False
     # Concept detail view
     selected_concept_idx: int = -1  # -1 means no selection
-    concept_memories: List[dict] = field(default_factory=list)  # Memories for selected concept
+    concept_memories: List[NormalizedMemory] = field(default_factory=list)  # Memories for selected concept
     show_concept_detail: bool = False
 
 
@@ -77,40 +106,21 @@ def render_concept_detail(state: MuseumState) -> Panel:
         return Panel(content, title="Concept Detail", border_style="cyan")
 
     concept = state.concepts[state.selected_concept_idx]
-    content.append(f"{TAG_ICON} {concept.name}\n", style="bold magenta")
-    content.append(f"   {concept.memory_count} memories\n\n", style="dim")
-
-    content.append("RELATED MEMORIES:\n", style="bold cyan")
-    content.append("\u2500" * 50 + "\n", style="dim")
+    tokens = [
+        (f"{TAG_ICON} {concept.name}\n", "bold magenta"),
+        (f"   {concept.memory_count} memories\n\n", "dim"),
+        ("RELATED MEMORIES:\n", "bold cyan"),
+        ("\u2500" * 50 + "\n", "dim"),
+    ]
 
     if state.concept_memories:
-        for i, memory in enumerate(state.concept_memories[:10], 1):
-            if isinstance(memory, dict):
-                mem_content = memory.get("content", memory.get("text", str(memory)))
-                quality = memory.get("quality", 0.5)
-            else:
-                mem_content = str(memory)
-                quality = 0.5
-
-            # Quality indicator
-            if quality >= 0.7:
-                q_icon = "\U0001f7e2"
-            elif quality >= 0.4:
-                q_icon = "\U0001f7e1"
-            else:
-                q_icon = "\U0001f534"
-
-            # Truncate long content
-            if len(mem_content) > 70:
-                mem_content = mem_content[:67] + "..."
-
-            content.append(f"{i}. {q_icon} ", style="dim")
-            content.append(f"{mem_content}\n", style="white")
+        for i, (mem_content, _, q_icon) in enumerate(map(normalize_memory, state.concept_memories[:10]), 1):
+            tokens += ((f"{i}. {q_icon} ", "dim"), (f"{truncate(mem_content, 70)}\n", "white"))
     else:
-        content.append("(No memories found for this concept)\n", style="dim italic")
+        tokens.append(("(No memories found for this concept)\n", "dim italic"))
 
-    content.append("\n[ESC]", style="bold yellow")
-    content.append(" Back to Museum", style="dim")
+    tokens += (("\n[ESC]", "bold yellow"), (" Back to Museum", "dim"))
+    content.append_tokens(tokens)
 
     return Panel(
         content,
@@ -127,13 +137,26 @@ def render_museum(state: MuseumState, width: int = 70) -> Panel:
     if state.show_concept_detail:
         return render_concept_detail(state)
 
-    content = Text()
+    # Fingerprint of everything drawn below; identical state reuses the Panel
+    stats = state.worker_stats
+    cache_key = (
+        width,
+        state.rag_connected,
+        state.selected_concept_idx,
+        tuple((w.wave_num, w.tasks_completed, w.tasks_partial, w.tasks_blocked)
+              for w in state.wave_history[-7:]),
+        stats.total_completed,
+        tuple(stats.by_status.items()),
+        tuple((c.name, c.memory_count, c.sample_text) for c in state.concepts[:7]),
+    )
+    cached = _render_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    # Two-column layout: Wave History | Emerged Concepts
-    # Build left column (Wave History)
-    left_col = Text()
-    left_col.append("WAVE HISTORY:\n", style="bold cyan")
+    # Assembled as (text, style) tokens and appended in one call
+    tokens = [("WAVE HISTORY:\n", "bold cyan")]
 
+    # Left section (Wave History)
     if state.wave_history:
         for wave in state.wave_history[-7:]:  # Show last 7 waves
             total = wave.tasks_completed + wave.tasks_partial + wave.tasks_blocked
@@ -144,28 +167,29 @@ def render_museum(state: MuseumState, width: int = 70) -> Panel:
             else:
                 status_icon = "\u26a0\ufe0f"  # Warning
 
-            left_col.append(f"Wave {wave.wave_num}: ", style="yellow")
-            left_col.append(f"{wave.tasks_completed}/{total} ", style="green")
-            left_col.append(f"{status_icon}\n")
+            tokens += (
+                (f"Wave {wave.wave_num}: ", "yellow"),
+                (f"{wave.tasks_completed}/{total} ", "green"),
+                (f"{status_icon}\n", None),
+            )
     else:
         # Show from worker stats if no wave history
-        stats = state.worker_stats
         if stats.total_completed > 0:
-            left_col.append(f"Completed: {stats.total_completed}\n", style="green")
-            if stats.by_status:
-                for status, count in stats.by_status.items():
-                    style = {"DONE": "green", "PARTIAL": "magenta", "BLOCKED": "red"}.get(status, "white")
-                    left_col.append(f"  {status}: {count}\n", style=style)
+            tokens.append((f"Completed: {stats.total_completed}\n", "green"))
+            for status, count in stats.by_status.items():
+                tokens.append((f"  {status}: {count}\n", _STATUS_STYLES.get(status, "white")))
         else:
-            left_col.append("No wave history yet\n", style="dim italic")
+            tokens.append(("No wave history yet\n", "dim italic"))
+
+    tokens.append(("\n", None))
+    tokens.append(("\u2500" * 30 + "\n", "dim"))
 
-    # Build right column (Emerged Concepts)
-    right_col = Text()
-    right_col.append("EMERGED CONCEPTS:", style="bold cyan")
+    # Right section (Emerged Concepts)
+    tokens.append(("EMERGED CONCEPTS:", "bold cyan"))
     if state.rag_connected:
-        right_col.append(" \U0001f7e2\n", style="green")
+        tokens.append((" \U0001f7e2\n", "green"))
     else:
-        right_col.append(" \U0001f534\n", style="red")
+        tokens.append((" \U0001f534\n", "red"))
 
     if state.concepts:
         for i, concept in enumerate(state.concepts[:7]):
@@ -177,48 +201,43 @@ def render_museum(state: MuseumState, width: int = 70) -> Panel:
                 marker = "  "
                 style = "white"
 
-            right_col.append(f"{marker}{TAG_ICON} ", style="dim")
-            right_col.append(f"{concept.name}", style=style)
-            right_col.append(f" ({concept.memory_count})\n", style="dim")
+            tokens += (
+                (f"{marker}{TAG_ICON} ", "dim"),
+                (f"{concept.name}", style),
+                (f" ({concept.memory_count})\n", "dim"),
+            )
 
             # Show sample text if available
-            if concept.sample_text:
-                sample = concept.sample_text[:35] + "..." if len(concept.sample_text) > 35 else concept.sample_text
-                right_col.append(f"     \u2514\u2500 \"{sample}\"\n", style="dim italic")
+            if concept.display_sample:
+                tokens.append((f"     \u2514\u2500 \"{concept.display_sample}\"\n", "dim italic"))
     else:
-        right_col.append("(No concepts yet)\n", style="dim italic")
-        right_col.append("Store memories to see\n", style="dim")
-        right_col.append("emerging patterns.\n", style="dim")
-
-    # Combine columns
-    content.append(left_col)
-    content.append("\n")
-    content.append("\u2500" * 30 + "\n", style="dim")
-    content.append(right_col)
+        tokens += (
+            ("(No concepts yet)\n", "dim italic"),
+            ("Store memories to see\n", "dim"),
+            ("emerging patterns.\n", "dim"),
+        )
 
     # Footer with controls
-    content.append("\n")
-    content.append("[UP/DOWN]", style="bold cyan")
-    content.append("=Select  ", style="dim")
-    content.append("[ENTER]", style="bold cyan")
-    content.append("=View  ", style="dim")
-    content.append("[R]", style="bold cyan")
-    content.append("=Refresh  ", style="dim")
-    content.append("[ESC]", style="bold yellow")
-    content.append("=Close", style="dim")
+    tokens += _MUSEUM_FOOTER
 
-    return Panel(
+    content = Text()
+    content.append_tokens(tokens)
+
+    return _render_cache.put(cache_key, Panel(
         content,
         title=f"{MUSEUM_ICON} ORSON HISTORICAL SOCIETY",
         border_style="magenta",
         width=width,
         height=24
-    )
+    ))
 
 
+@ttl_cache_swr(ttl=30.0, stale_ttl=300.0)
 async def fetch_concepts(rag_client) -> List[Concept]:
     """Fetch concept clusters from RAG Brain.
 
+    Cached for 30s, then served stale for up to 5 minutes while it refreshes.
+
     Args:
         rag_client: RAGClient instance
 
@@ -255,16 +274,13 @@ async def fetch_concept_memories(concept_name: str, rag_client, limit: int = 10)
     return memories
 
 
-def refresh_museum_concepts(state: MuseumState) -> MuseumState:
+def refresh_museum_concepts(state: MuseumState, rag_client=None) -> MuseumState:
     """Refresh RAG concepts for museum display (sync wrapper)."""
-    from ..rag_client import get_rag_client
-    rag_client = get_rag_client()
+    if rag_client is None:
+        from ..rag_client import get_rag_client
+        rag_client = get_rag_client()
 
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    loop = get_loop()
 
     async def _fetch():
         connected = await rag_client.health()
@@ -283,24 +299,21 @@ def refresh_museum_concepts(state: MuseumState) -> MuseumState:
     return state
 
 
-def load_concept_memories(state: MuseumState) -> MuseumState:
+def load_concept_memories(state: MuseumState, rag_client=None) -> MuseumState:
     """Load memories for the currently selected concept (sync wrapper)."""
     if state.selected_concept_idx < 0 or state.selected_concept_idx >= len(state.concepts):
         return state
 
-    from ..rag_client import get_rag_client
-    rag_client = get_rag_client()
+    if rag_client is None:
+        from ..rag_client import get_rag_client
+        rag_client = get_rag_client()
 
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    loop = get_loop()
 
     concept = state.concepts[state.selected_concept_idx]
     try:
         memories = loop.run_until_complete(fetch_concept_memories(concept.name, rag_client))
-        state.concept_memories = memories
+        state.concept_memories = [normalize_memory(m) for m in memories]
     except Exception:
         state.concept_memories = []
 
@@ -314,16 +327,16 @@ def load_museum_data(swarm_root: Path) -> MuseumState:
 
     if state_file.exists():
         try:
-            with open(state_file) as f:
-                data = json.load(f)
+            raw = state_file.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
 
             completed = data.get("completed_tasks", [])
             state.worker_stats.total_completed = len(completed)
             state.worker_stats.total_spawned = len(completed) + len(data.get("active_zerglings", []))
 
-            # Count by status from completed tasks
-            for task_id in completed:
-                state.worker_stats.by_status["DONE"] = state.worker_stats.by_status.get("DONE", 0) + 1
+            # STATE.json only lists completed task ids, so they all count as DONE
+            if completed:
+                state.worker_stats.by_status["DONE"] += len(completed)
 
         except (json.JSONDecodeError, IOError):
             pass
@@ -6,18 +6,96 @@ Stores findings to RAG Brain with quality feedback.
 "All the news that's fit to embed."
 """
 
+import asyncio
+import fnmatch
+import hashlib
+import json
+import os
+import queue
+import re
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
-from typing import List, Optional, Callable, Any
+from pathlib import Path, PurePath
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Callable, Any
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from ._cache import PanelCache
+
 NEWSPAPER_ICON = "📰"
+_REMEMBER_CONCURRENCY = 8  # Max in-flight RAG remember calls per file
+MAX_RECENT_FINDINGS = 20
+
+_render_cache = PanelCache(maxsize=8)
+
+# blake2b(file name + chunk) -> [memory_id, quality] for chunks already stored
+# in RAG Brain, in insertion order. Persisted (once set_chunk_cache_dir() has
+# picked a location) so unchanged chunks aren't re-sent across sessions.
+MAX_CHUNK_CACHE = 20_000
+_CHUNK_CACHE_NAME = "rag_chunk_cache.json"
+_chunk_cache_file: Optional[Path] = None
+_chunk_cache: Optional[Dict[str, list]] = None
+
+
+def set_chunk_cache_dir(cache_dir: Optional[Path]) -> None:
+    """Persist the chunk cache under cache_dir (None keeps it in memory only)."""
+    global _chunk_cache_file, _chunk_cache
+    _chunk_cache_file = Path(cache_dir) / _CHUNK_CACHE_NAME if cache_dir is not None else None
+    _chunk_cache = None  # Reload from the new location on next use
 
 
-@dataclass
+def clear_chunk_cache() -> None:
+    """Forget every stored chunk, e.g. after RAG Brain memories were pruned."""
+    global _chunk_cache
+    _chunk_cache = None
+    if _chunk_cache_file is not None:
+        try:
+            _chunk_cache_file.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _load_chunk_cache() -> Dict[str, list]:
+    global _chunk_cache
+    if _chunk_cache is None:
+        _chunk_cache = {}
+        if _chunk_cache_file is not None:
+            try:
+                loaded = json.loads(_chunk_cache_file.read_bytes())
+            except (OSError, ValueError):
+                loaded = None
+            if isinstance(loaded, dict):
+                _chunk_cache = loaded
+    return _chunk_cache
+
+
+def _save_chunk_cache() -> None:
+    """Trim to MAX_CHUNK_CACHE and write atomically; failures only cost a re-embed."""
+    excess = len(_chunk_cache) - MAX_CHUNK_CACHE
+    if excess > 0:
+        for key in list(islice(_chunk_cache, excess)):  # Oldest entries first
+            del _chunk_cache[key]
+    if _chunk_cache_file is None:
+        return
+    try:
+        _chunk_cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _chunk_cache_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(_chunk_cache))
+        os.replace(tmp, _chunk_cache_file)
+    except OSError:
+        pass
+
+
+def _chunk_key(filename: str, chunk: str) -> str:
+    data = f"{filename}\0{chunk}".encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@dataclass(slots=True)
 class RAGFinding:
     """A finding stored in RAG Brain."""
     memory_id: str
@@ -25,14 +103,21 @@ class RAGFinding:
     category: str
     quality: float
     stored_at: datetime = field(default_factory=datetime.now)
+    _quality_icon: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def quality_icon(self) -> str:
-        if self.quality >= 0.7:
-            return "🟢"
-        elif self.quality >= 0.4:
-            return "🟡"
-        return "🔴"
+        # Memoized: quality is fixed once the finding is stored
+        icon = self._quality_icon
+        if icon is None:
+            if self.quality >= 0.7:
+                icon = "🟢"
+            elif self.quality >= 0.4:
+                icon = "🟡"
+            else:
+                icon = "🔴"
+            self._quality_icon = icon
+        return icon
 
     @property
     def quality_label(self) -> str:
@@ -42,16 +127,34 @@ class RAGFinding:
             return "Accepted"
         return "Rejected"
 
-@dataclass
+@dataclass(slots=True)
 class WatchedPath:
     """A path being watched for changes."""
     path: str
     pattern: str  # e.g., "*.py", "**/*.md"
-    last_checked: datetime = field(default_factory=datetime.now)
+    last_checked_ts: float = field(default_factory=time.time)  # Epoch seconds; 0 disables change counting
     last_modified: Optional[datetime] = None
     change_count: int = 0
+    # Compiled from pattern in __post_init__: "**/" prefix, and a regex match for
+    # the file-name glob (None when the pattern has directory parts)
+    _recursive: bool = field(default=False, init=False, repr=False, compare=False)
+    _name_match: Optional[Callable] = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self):
+        self._recursive = self.pattern.startswith("**/")
+        name_glob = self.pattern[3:] if self._recursive else self.pattern
+        if "/" not in name_glob and "**" not in name_glob:
+            self._name_match = re.compile(fnmatch.translate(name_glob)).match
+
+    @property
+    def last_checked(self) -> datetime:
+        return datetime.fromtimestamp(self.last_checked_ts)
+
+    @last_checked.setter
+    def last_checked(self, value: datetime) -> None:
+        self.last_checked_ts = value.timestamp()
+
+@dataclass(slots=True)
 class ResearchItem:
     """An item in the research queue."""
     path: str
@@ -59,17 +162,25 @@ class ResearchItem:
     queued_at: datetime = field(default_factory=datetime.now)
     processed: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class NewspaperState:
     """State for the newspaper office."""
     watch_list: List[WatchedPath] = field(default_factory=list)
     research_queue: List[ResearchItem] = field(default_factory=list)
-    recent_findings: List[RAGFinding] = field(default_factory=list)
+    recent_findings: Deque[RAGFinding] = field(default_factory=lambda: deque(maxlen=MAX_RECENT_FINDINGS))
     is_visible: bool = False
     last_scan: Optional[datetime] = None
     input_mode: bool = False
     current_input: str = ""
     rag_callback: Optional[Callable] = None  # Async callback to RAG remember
+    # Set by start_watching(): (watch, path) events pushed by the watchdog thread
+    change_queue: "queue.SimpleQueue" = field(default_factory=queue.SimpleQueue, repr=False, compare=False)
+    observer: Any = field(default=None, repr=False, compare=False)
+    # path -> unprocessed ResearchItem; coalesces repeat queueing of one file
+    _pending: Dict[str, ResearchItem] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._pending = {r.path: r for r in self.research_queue if not r.processed}
 
 def init_default_watches(project_root: Path) -> List[WatchedPath]:
     """Initialize default watch paths."""
@@ -79,80 +190,209 @@ def init_default_watches(project_root: Path) -> List[WatchedPath]:
         WatchedPath(path=str(project_root / "tests"), pattern="**/*.py"),
     ]
 
+def _iter_changed(watch: WatchedPath, since: float):
+    """Yield paths under the watch matching its pattern with st_mtime > since.
+
+    Handles "name-glob" and "**/name-glob" patterns with os.scandir, using
+    the stat cached on each DirEntry; other patterns fall back to Path.glob.
+    """
+    match = watch._name_match
+    if match is None:
+        for file_path in Path(watch.path).glob(watch.pattern):
+            if file_path.is_file() and file_path.stat().st_mtime > since:
+                yield str(file_path)
+        return
+
+    recursive = watch._recursive
+    stack = [watch.path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_file():
+                    if match(entry.name) and entry.stat().st_mtime > since:
+                        yield entry.path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+def _path_matcher(watch: WatchedPath) -> Callable[[str], bool]:
+    """Build a predicate telling whether an event path matches a watch."""
+    root = os.path.normpath(watch.path)
+    match = watch._name_match
+    if match is None:
+        return lambda path: PurePath(os.path.relpath(path, root)).match(watch.pattern)
+    if watch._recursive:
+        return lambda path: match(os.path.basename(path)) is not None
+    return lambda path: os.path.dirname(path) == root and match(os.path.basename(path)) is not None
+
+def start_watching(state: NewspaperState) -> bool:
+    """Watch state.watch_list with OS file events instead of polling.
+
+    Uses watchdog (inotify on Linux) when installed; events are queued and
+    picked up by scan_for_changes(). Returns False if watchdog is missing,
+    in which case scan_for_changes() keeps walking the watched trees.
+    """
+    if state.observer is not None:
+        return True
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return False
+
+    change_queue = state.change_queue
+
+    class _Handler(FileSystemEventHandler):
+        def __init__(self, watch: WatchedPath):
+            self.watch = watch
+            self.matches = _path_matcher(watch)
+
+        def on_any_event(self, event):
+            if event.is_directory or event.event_type not in ("created", "modified", "moved"):
+                return
+            path = os.fsdecode(getattr(event, "dest_path", "") or event.src_path)
+            if self.matches(path):
+                change_queue.put((self.watch, path))
+
+    observer = Observer()
+    observer.daemon = True
+    for watch in state.watch_list:
+        if os.path.isdir(watch.path):
+            observer.schedule(_Handler(watch), watch.path, recursive=watch.pattern.startswith("**/") or "/" in watch.pattern)
+    observer.start()
+    state.observer = observer
+    return True
+
+def stop_watching(state: NewspaperState) -> None:
+    """Stop the watchdog observer started by start_watching()."""
+    if state.observer is not None:
+        state.observer.stop()
+        state.observer.join(timeout=1.0)
+        state.observer = None
+
+def _drain_changes(state: NewspaperState) -> List[str]:
+    """Collect paths queued by the watchdog observer, one entry per file."""
+    changed = {}
+    while True:
+        try:
+            watch, path = state.change_queue.get_nowait()
+        except queue.Empty:
+            break
+        if path not in changed:
+            changed[path] = None
+            watch.change_count += 1
+    return list(changed)
+
 def scan_for_changes(state: NewspaperState) -> List[str]:
     """Scan watched paths for changes since last check."""
+    now_ts = time.time()
+    if state.observer is not None:
+        changes = _drain_changes(state)
+        for watch in state.watch_list:
+            watch.last_checked_ts = now_ts
+        state.last_scan = datetime.fromtimestamp(now_ts)
+        return changes
+
     changes = []
-    now = datetime.now()
 
     for watch in state.watch_list:
-        path = Path(watch.path)
-        if not path.exists():
+        if not os.path.isdir(watch.path):
             continue
 
-        # Check modification times
-        for file_path in path.glob(watch.pattern):
-            if file_path.is_file():
-                mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                if watch.last_checked and mtime > watch.last_checked:
-                    changes.append(str(file_path))
-                    watch.change_count += 1
+        # Check modification times as raw epoch floats
+        if watch.last_checked_ts:
+            changed = list(_iter_changed(watch, watch.last_checked_ts))
+            changes.extend(changed)
+            watch.change_count += len(changed)
 
-        watch.last_checked = now
+        watch.last_checked_ts = now_ts
 
-    state.last_scan = now
+    state.last_scan = datetime.fromtimestamp(now_ts)
     return changes
 
 def queue_for_research(state: NewspaperState, path: str, reason: str = "manual"):
-    """Add a file to the research queue."""
+    """Add a file to the research queue (no-op if it's already pending)."""
+    if path in state._pending:
+        return
     item = ResearchItem(path=path, reason=reason)
     state.research_queue.append(item)
+    state._pending[path] = item
 
 def render_newspaper(state: NewspaperState) -> Panel:
     """Render the newspaper office panel."""
-    content = Text()
+    pending = [r for r in state.research_queue if not r.processed]
+    # Newest five findings, oldest first, without copying the whole deque
+    recent = list(islice(reversed(state.recent_findings), 5))[::-1]
+
+    # Fingerprint of everything drawn below; identical state reuses the Panel
+    cache_key = (
+        state.input_mode,
+        state.current_input,
+        len(state.recent_findings),
+        tuple((f.content_preview, f.quality) for f in recent),
+        tuple((w.path, w.pattern, w.change_count) for w in state.watch_list[:3]),
+        len(pending),
+        tuple((r.path, r.reason) for r in pending[:3]),
+    )
+    cached = _render_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Assembled as (text, style) tokens and appended in one call
+    tokens = []
 
     # Input mode indicator
     if state.input_mode:
-        content.append("📝 ADD RESEARCH (type, Enter to submit, Esc to cancel)\n", style="bold yellow")
-        content.append(f"  > {state.current_input}_\n\n", style="white")
+        tokens += (
+            ("📝 ADD RESEARCH (type, Enter to submit, Esc to cancel)\n", "bold yellow"),
+            (f"  > {state.current_input}_\n\n", "white"),
+        )
 
     # Recent findings with quality feedback
     if state.recent_findings:
-        content.append("📚 RECENT FINDINGS\n", style="bold magenta")
-        for finding in state.recent_findings[-5:]:
-            content.append(f"  {finding.quality_icon} ", style="white")
-            content.append(f"{finding.content_preview[:25]}... ", style="white")
-            content.append(f"({finding.quality:.2f})\n", style="dim")
-        content.append("\n")
+        tokens.append(("📚 RECENT FINDINGS\n", "bold magenta"))
+        for finding in recent:
+            tokens += (
+                (f"  {finding.quality_icon} ", "white"),
+                (f"{finding.content_preview[:25]}... ", "white"),
+                (f"({finding.quality:.2f})\n", "dim"),
+            )
+        tokens.append(("\n", None))
 
     # Watch list (condensed)
-    content.append("👁️ WATCHING\n", style="bold cyan")
+    tokens.append(("👁️ WATCHING\n", "bold cyan"))
     for watch in state.watch_list[:3]:
         path_short = Path(watch.path).name
-        content.append(f"  📁 {path_short}/{watch.pattern} ", style="white")
-        content.append(f"({watch.change_count})\n", style="yellow")
+        tokens += (
+            (f"  📁 {path_short}/{watch.pattern} ", "white"),
+            (f"({watch.change_count})\n", "yellow"),
+        )
 
     # Research queue
-    content.append("\n📋 QUEUE\n", style="bold green")
-    pending = [r for r in state.research_queue if not r.processed]
+    tokens.append(("\n📋 QUEUE\n", "bold green"))
     if pending:
         for item in pending[:3]:
-            content.append(f"  • {Path(item.path).name} ", style="white")
-            content.append(f"[{item.reason}]\n", style="dim")
+            tokens += ((f"  • {Path(item.path).name} ", "white"), (f"[{item.reason}]\n", "dim"))
         if len(pending) > 3:
-            content.append(f"  +{len(pending)-3} more\n", style="dim")
+            tokens.append((f"  +{len(pending)-3} more\n", "dim"))
     else:
-        content.append("  (empty)\n", style="dim")
+        tokens.append(("  (empty)\n", "dim"))
 
     # Instructions
-    content.append("\n[a]=Add  [p]=Process  [Esc]=Close", style="dim")
+    tokens.append(("\n[a]=Add  [p]=Process  [Esc]=Close", "dim"))
 
-    return Panel(
+    content = Text()
+    content.append_tokens(tokens)
+
+    return _render_cache.put(cache_key, Panel(
         content,
         title=f"{NEWSPAPER_ICON} NEWSPAPER OFFICE - Researcher",
         subtitle=f"Findings: {len(state.recent_findings)} | Queue: {len(pending)}",
         border_style="magenta"
-    )
+    ))
 
 def get_recent_changes(state: NewspaperState, limit: int = 10) -> List[str]:
     """Get list of recently changed files."""
@@ -188,10 +428,7 @@ async def store_to_rag(state: NewspaperState, content: str, category: str = "ins
             category=category,
             quality=result.get("quality", 0.5)
         )
-        state.recent_findings.append(finding)
-        # Keep only last 20 findings
-        if len(state.recent_findings) > 20:
-            state.recent_findings = state.recent_findings[-20:]
+        state.recent_findings.append(finding)  # deque drops the oldest past MAX_RECENT_FINDINGS
         return finding
     return None
 
@@ -220,36 +457,70 @@ async def process_file_to_rag(state: NewspaperState, file_path: str,
     filename = path.name
     tags = [filename, path.suffix.lstrip('.')]
 
-    # Chunk the file
+    # Chunk the file lazily; chunk_fn may return a list or a generator
     if chunk_fn:
-        chunks = chunk_fn(path)
+        chunks = iter(chunk_fn(path))
     else:
         try:
-            chunks = [path.read_text()]
+            chunks = iter((path.read_text(),))
         except Exception:
             return []
 
-    findings = []
-    for i, chunk in enumerate(chunks):
-        result = await rag_client.remember(
+    async def _remember(i: int, chunk: str):
+        return await rag_client.remember(
             chunk,
             category="code_snippet",
             tags=tags + [f"chunk_{i}"]
         )
-        if result and isinstance(result, dict):
+
+    # Chunks already stored with identical content reuse their memory id.
+    # New chunks go out in bounded batches so only one batch of chunk text
+    # is held at a time and a large file doesn't flood the server.
+    chunk_cache = _load_chunk_cache()
+    results = []
+    dirty = False
+    index = 0
+    while True:
+        batch = list(islice(chunks, _REMEMBER_CONCURRENCY))
+        if not batch:
+            break
+        pending = []
+        for chunk in batch:
+            key = _chunk_key(filename, chunk)
+            cached = chunk_cache.get(key)
+            if cached is None:
+                pending.append((len(results), key, _remember(index, chunk)))
+            results.append(cached)
+            index += 1
+        if pending:
+            sent = await asyncio.gather(*(coro for _, _, coro in pending))
+            for (i, key, _), result in zip(pending, sent):
+                if result and isinstance(result, dict):
+                    results[i] = chunk_cache[key] = [
+                        result.get("id", result.get("memory_id", "unknown")),
+                        result.get("quality", 0.5),
+                    ]
+            dirty = True
+    if dirty:
+        _save_chunk_cache()
+
+    findings = []
+    for i, cached in enumerate(results):
+        if cached is not None:
+            memory_id, quality = cached
             finding = RAGFinding(
-                memory_id=result.get("id", result.get("memory_id", "unknown")),
+                memory_id=memory_id,
                 content_preview=f"{filename}:{i}",
                 category="code_snippet",
-                quality=result.get("quality", 0.5)
+                quality=quality
             )
             findings.append(finding)
             state.recent_findings.append(finding)
 
     # Mark item as processed in queue
-    for item in state.research_queue:
-        if item.path == file_path:
-            item.processed = True
+    item = state._pending.pop(file_path, None)
+    if item is not None:
+        item.processed = True
 
     return findings
 
@@ -15,12 +15,19 @@ from rich.table import Table
 from rich.text import Text
 from rich.markdown import Markdown
 
+from ..event_loop import get_loop
+from ._cache import PanelCache, ttl_cache_swr
+from ._memory import NormalizedMemory, normalize_memory
+from ._text import truncate
+
 SCHOOL_ICON = "\U0001f3eb"  # School building emoji
 BOOK_ICON = "\U0001f4d6"  # Open book
 GRAD_ICON = "\U0001f393"  # Graduation cap
 BRAIN_ICON = "\U0001f9e0"  # Brain
 INJECT_ICON = "\U0001f489"  # Syringe (injection)
 
+_render_cache = PanelCache(maxsize=8)
+
 TASK_TYPES = {
     "ADD_STUB": "Skeleton + TODOs",
     "ADD_PURE_FN": "One function + doc",
@@ -41,30 +48,66 @@ LANE_PROMPTS = {
     "INTEGRATION": "Glue only. No domain logic. Max 3 files."
 }
 
+# Curriculum section never changes, so its tokens are built once
+_CURRICULUM_TOKENS = ((f"{BOOK_ICON} CURRICULUM\n", "bold cyan"),) + tuple(
+    token
+    for task_type, desc in TASK_TYPES.items()
+    for token in ((f"  {task_type}: ", "yellow"), (f"{desc}\n", "dim"))
+)
+
+
+def _lane_prompt_tokens(selected_lane: Optional[str]) -> tuple:
+    """Tokens for the LANE PROMPTS section with ``selected_lane`` marked."""
+    tokens = [(f"\n{GRAD_ICON} LANE PROMPTS\n", "bold cyan")]
+    for lane, prompt in LANE_PROMPTS.items():
+        marker = "\u25b6 " if lane == selected_lane else "  "
+        style = "bold green" if lane == selected_lane else "green"
+        tokens += ((f"{marker}[{lane}] ", style), (f"{prompt}\n", "white"))
+    return tuple(tokens)
+
 
-@dataclass
+# Lane prompts only vary by which lane is selected; None covers an unknown lane
+_LANE_TOKENS = {lane: _lane_prompt_tokens(lane) for lane in (*LANE_PROMPTS, None)}
+
+
+@dataclass(slots=True)
 class SchoolState:
     """State for school display."""
     prompts_content: str = ""
     selected_lane: str = "KERNEL"
     is_visible: bool = False
     # RAG knowledge for pre-spawn injection
-    lane_knowledge: Dict[str, List[dict]] = field(default_factory=dict)
+    lane_knowledge: Dict[str, List[NormalizedMemory]] = field(default_factory=dict)
     last_knowledge_fetch: Optional[datetime] = None
     rag_connected: bool = False
 
 
-def load_prompts(swarm_root: Path) -> str:
-    """Load PROMPTS.md content."""
-    prompts_file = swarm_root / "PROMPTS.md"
-    if prompts_file.exists():
-        return prompts_file.read_text()
-    return "No prompts file found"
+# (path, st_mtime_ns, st_size) -> PROMPTS.md text; holds only the latest read
+_prompts_cache: Dict[tuple, str] = {}
 
 
+def load_prompts(swarm_root: Path) -> str:
+    """Load PROMPTS.md content (re-read only when the file changes)."""
+    prompts_file = swarm_root / "PROMPTS.md"
+    try:
+        st = prompts_file.stat()
+    except OSError:
+        return "No prompts file found"
+    key = (str(prompts_file), st.st_mtime_ns, st.st_size)
+    content = _prompts_cache.get(key)
+    if content is None:
+        content = prompts_file.read_text()
+        _prompts_cache.clear()
+        _prompts_cache[key] = content
+    return content
+
+
+@ttl_cache_swr(ttl=30.0, stale_ttl=300.0)
 async def fetch_lane_knowledge(lane: str, rag_client) -> List[dict]:
     """Fetch lane-specific knowledge from RAG Brain.
 
+    Cached for 30s, then served stale for up to 5 minutes while it refreshes.
+
     Args:
         lane: The lane to fetch knowledge for (KERNEL, ML, etc.)
         rag_client: RAGClient instance
@@ -78,24 +121,18 @@ async def fetch_lane_knowledge(lane: str, rag_client) -> List[dict]:
 
 
 async def fetch_all_lane_knowledge(rag_client) -> Dict[str, List[dict]]:
-    """Fetch knowledge for all lanes from RAG Brain."""
-    knowledge = {}
-    for lane in LANE_PROMPTS.keys():
-        memories = await fetch_lane_knowledge(lane, rag_client)
-        knowledge[lane] = memories
-    return knowledge
+    """Fetch knowledge for all lanes from RAG Brain (lanes queried concurrently)."""
+    results = await asyncio.gather(*(fetch_lane_knowledge(lane, rag_client) for lane in LANE_PROMPTS))
+    return dict(zip(LANE_PROMPTS, results))
 
 
-def fetch_lane_knowledge_sync(lane: str) -> List[dict]:
+def fetch_lane_knowledge_sync(lane: str, rag_client=None) -> List[dict]:
     """Synchronous wrapper to fetch lane knowledge."""
-    from ..rag_client import get_rag_client
-    rag_client = get_rag_client()
+    if rag_client is None:
+        from ..rag_client import get_rag_client
+        rag_client = get_rag_client()
 
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    loop = get_loop()
 
     try:
         return loop.run_until_complete(fetch_lane_knowledge(lane, rag_client))
@@ -103,28 +140,29 @@ def fetch_lane_knowledge_sync(lane: str) -> List[dict]:
         return []
 
 
-def refresh_school_knowledge(state: SchoolState) -> SchoolState:
+def refresh_school_knowledge(state: SchoolState, rag_client=None) -> SchoolState:
     """Refresh RAG knowledge for the selected lane."""
-    from ..rag_client import get_rag_client
-    rag_client = get_rag_client()
+    if rag_client is None:
+        from ..rag_client import get_rag_client
+        rag_client = get_rag_client()
 
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    loop = get_loop()
 
     async def _fetch():
-        connected = await rag_client.health()
+        # Health check overlaps the knowledge fetch; results are dropped if offline
+        connected, knowledge = await asyncio.gather(
+            rag_client.health(), fetch_all_lane_knowledge(rag_client)
+        )
         if not connected:
             return False, {}
-        knowledge = await fetch_all_lane_knowledge(rag_client)
         return True, knowledge
 
     try:
         connected, knowledge = loop.run_until_complete(_fetch())
         state.rag_connected = connected
-        state.lane_knowledge = knowledge
+        state.lane_knowledge = {
+            lane: [normalize_memory(m) for m in memories] for lane, memories in knowledge.items()
+        }
         state.last_knowledge_fetch = datetime.now()
     except Exception:
         state.rag_connected = False
@@ -134,73 +172,58 @@ def refresh_school_knowledge(state: SchoolState) -> SchoolState:
 
 def render_school(state: SchoolState) -> Panel:
     """Render school panel with curriculum, prompts, and pre-spawn knowledge."""
-    content = Text()
+    # Memories are normalized on refresh; map() only converts entries set
+    # directly on the state. The hashable tuples double as the cache key.
+    lane_memories = list(map(normalize_memory, state.lane_knowledge.get(state.selected_lane, [])[:5]))
 
-    # Task types curriculum
-    content.append(f"{BOOK_ICON} CURRICULUM\n", style="bold cyan")
-    for task_type, desc in TASK_TYPES.items():
-        content.append(f"  {task_type}: ", style="yellow")
-        content.append(f"{desc}\n", style="dim")
+    cache_key = (state.selected_lane, state.rag_connected, tuple(lane_memories))
+    cached = _render_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    content.append(f"\n{GRAD_ICON} LANE PROMPTS\n", style="bold cyan")
-    for lane, prompt in LANE_PROMPTS.items():
-        marker = "\u25b6 " if lane == state.selected_lane else "  "
-        style = "bold green" if lane == state.selected_lane else "green"
-        content.append(f"{marker}[{lane}] ", style=style)
-        content.append(f"{prompt}\n", style="white")
+    # Assembled as (text, style) tokens and appended in one call
+    tokens = list(_CURRICULUM_TOKENS)
+    tokens += _LANE_TOKENS.get(state.selected_lane, _LANE_TOKENS[None])
 
     # Pre-Spawn Knowledge section
-    content.append(f"\n{BRAIN_ICON} PRE-SPAWN KNOWLEDGE", style="bold magenta")
+    tokens.append((f"\n{BRAIN_ICON} PRE-SPAWN KNOWLEDGE", "bold magenta"))
     if state.rag_connected:
-        content.append(" \U0001f7e2\n", style="green")
+        tokens.append((" \U0001f7e2\n", "green"))
     else:
-        content.append(" \U0001f534 (RAG offline)\n", style="red")
+        tokens.append((" \U0001f534 (RAG offline)\n", "red"))
 
-    lane_memories = state.lane_knowledge.get(state.selected_lane, [])
     if lane_memories:
-        content.append(f"  Knowledge for [{state.selected_lane}]:\n", style="dim")
-        for i, memory in enumerate(lane_memories[:5], 1):
-            # Handle different memory formats
-            if isinstance(memory, dict):
-                mem_content = memory.get("content", memory.get("text", str(memory)))
-                quality = memory.get("quality", 0.5)
-            else:
-                mem_content = str(memory)
-                quality = 0.5
-
-            # Truncate long content
-            if len(mem_content) > 60:
-                mem_content = mem_content[:57] + "..."
-
-            # Quality indicator
-            if quality >= 0.7:
-                q_icon = "\U0001f7e2"
-            elif quality >= 0.4:
-                q_icon = "\U0001f7e1"
-            else:
-                q_icon = "\U0001f534"
-
-            content.append(f"  {i}. {q_icon} ", style="dim")
-            content.append(f"{mem_content}\n", style="white")
-
-        content.append(f"\n  {INJECT_ICON} ", style="cyan")
-        content.append(f"These will be injected into worker prompts\n", style="dim italic")
+        tokens.append((f"  Knowledge for [{state.selected_lane}]:\n", "dim"))
+        for i, (mem_content, _, q_icon) in enumerate(lane_memories, 1):
+            tokens += ((f"  {i}. {q_icon} ", "dim"), (f"{truncate(mem_content, 60)}\n", "white"))
+
+        tokens += (
+            (f"\n  {INJECT_ICON} ", "cyan"),
+            ("These will be injected into worker prompts\n", "dim italic"),
+        )
     else:
-        content.append("  (No knowledge available for this lane)\n", style="dim italic")
-        content.append("  Press [R] to refresh from RAG Brain\n", style="dim")
+        tokens += (
+            ("  (No knowledge available for this lane)\n", "dim italic"),
+            ("  Press [R] to refresh from RAG Brain\n", "dim"),
+        )
 
     # Footer with controls
-    content.append("\n[1-5]", style="bold cyan")
-    content.append("=Select Lane  ", style="dim")
-    content.append("[R]", style="bold cyan")
-    content.append("=Refresh  ", style="dim")
-    content.append("[ESC]", style="bold yellow")
-    content.append("=Close", style="dim")
-
-    return Panel(
+    tokens += (
+        ("\n[1-5]", "bold cyan"),
+        ("=Select Lane  ", "dim"),
+        ("[R]", "bold cyan"),
+        ("=Refresh  ", "dim"),
+        ("[ESC]", "bold yellow"),
+        ("=Close", "dim"),
+    )
+
+    content = Text()
+    content.append_tokens(tokens)
+
+    return _render_cache.put(cache_key, Panel(
         content,
         title=f"{SCHOOL_ICON} SCHOOL - Training Center",
         border_style="yellow",
         width=75,
         height=28
-    )
+    ))
@@ -7,19 +7,32 @@ Theme: Midwestern small town meets Starcraft Zerg.
 
 import asyncio
 import atexit
+import ctypes
+import gc
 import json
 import os
-import queue
+import re
 import signal
 import sys
 import select
+import threading
+import time
 import termios
 import tty
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Callable
+from collections import Counter, deque
+from itertools import islice
+from typing import Deque, Dict, Optional, Callable, Tuple
 from dataclasses import dataclass, field
+from enum import IntFlag, auto
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .event_loop import get_loop
 from .mcp_client import MCPClient, get_client
 from .rag_client import RAGClient, get_rag_client
 from .spawner import (
@@ -27,13 +40,18 @@ from .spawner import (
     check_tmux_available, check_claude_available, kill_all_workers, get_worker_output
 )
 from .buildings.museum import MuseumState, render_museum, load_museum_data, refresh_museum_concepts, load_concept_memories
-from .buildings.apartments import ApartmentsState, IdleWorker, spawn_worker_from_pool, return_worker_to_pool
+from .buildings.apartments import (
+    ApartmentsState, IdleWorker, add_worker_to_pool, has_idle_worker, spawn_worker_from_pool,
+    return_worker_to_pool
+)
 from .buildings.newspaper import (
     NewspaperState, render_newspaper, scan_for_changes, queue_for_research,
-    store_to_rag, process_queue, init_default_watches, RAGFinding
+    store_to_rag, process_queue, init_default_watches, RAGFinding, set_chunk_cache_dir
+)
+from .rag_client import iter_chunks, format_quality_display
+from .buildings.school import (
+    SchoolState, NormalizedMemory, render_school, load_prompts, refresh_school_knowledge, fetch_lane_knowledge_sync
 )
-from .rag_client import chunk_file, format_quality_display
-from .buildings.school import SchoolState, render_school, load_prompts, refresh_school_knowledge, fetch_lane_knowledge_sync
 from .buildings.mcdonalds import McDonaldsState, render_mcdonalds
 from .buildings.brain import BrainPanelState, render_brain_panel, render_brain_status_indicator
 from .buildings.daemons import DaemonConfig, DaemonPanelState, render_daemons_panel, get_daemon_summary
@@ -63,13 +81,101 @@ STATE_FILE = SWARM_ROOT / "STATE.json"
 TASKS_DIR = SWARM_ROOT / "TASKS"
 INBOX_DIR = SWARM_ROOT / "INBOX"
 OUTBOX_DIR = SWARM_ROOT / "OUTBOX"
+CACHE_DIR = SWARM_ROOT / "CACHE"
 
 # Lanes in the swarm
-LANES = ["KERNEL", "ML", "QUANT", "DEX", "INTEGRATION"]
+LANES = ("KERNEL", "ML", "QUANT", "DEX", "INTEGRATION")
+
+# String forms for the per-refresh I/O paths, so each syscall skips the
+# Path -> str conversion. The Path versions stay for cold-path joining.
+STATE_FILE_STR = os.fspath(STATE_FILE)
+STATE_TMP_STR = os.fspath(STATE_FILE.with_suffix(".tmp"))
+TASKS_DIR_STR = os.fspath(TASKS_DIR)
+INBOX_DIR_STR = os.fspath(INBOX_DIR)
+_LANE_DIR_STRS = {lane: os.path.join(TASKS_DIR_STR, lane) for lane in LANES}
+
+
+# === Constants ===
+MAX_RADIO_EVENTS = 50
+MAX_COMPLETED_WORKERS = 100
+MAX_CEMETERY = 500
+MAX_DECOMPOSE_GOAL_LENGTH = 500
+MAX_QUEUED_EVENTS = 100
+STATE_SAVE_DELAY = 0.1  # Seconds to coalesce save_state() calls
+# os.replace already keeps STATE.json whole; fsync only adds power-loss durability
+STATE_FSYNC = os.environ.get("ZERG_STATE_FSYNC") == "1"
+MONITOR_POLL_INTERVAL = 5.0  # Max seconds between tmux checks in the async monitor
+MONITOR_MIN_SLEEP = 1.0
+
+
+# Debounced STATE.json writes (see save_state)
+_save_lock = threading.Lock()
+_pending_save: Optional[dict] = None
+_save_timer: Optional[threading.Timer] = None
+# ((st_ino, st_mtime_ns, st_size), parsed STATE.json) from the last read
+_state_file_cache: Optional[tuple] = None
+# (file key after our last write, payload minus last_updated)
+_last_state_write: Optional[tuple] = None
+# glibc's malloc_trim hands freed heap pages back to the OS; long sessions
+# otherwise keep their peak RSS. None on non-glibc platforms.
+try:
+    _malloc_trim = ctypes.CDLL("libc.so.6").malloc_trim
+except (OSError, AttributeError):
+    _malloc_trim = None
+MALLOC_TRIM_EVERY = 300  # refresh_state() calls, ~10 minutes at the 2s interval
+_refresh_count = 0
+# Task card path -> (file key, (status, type)); see read_task_meta. Each
+# scan_tasks / fetch_tasks_from_mcp pass prunes it to the cards it saw.
+_task_meta_cache: Dict[str, Tuple[tuple, Tuple[str, str]]] = {}
+# Lines that can carry task metadata; everything else is skipped unsplit
+_TASK_META_LINE_RE = re.compile(r"^[^\n]*(?:Status|Type)[^\n]*", re.M)
 
 
 # === State Management ===
-@dataclass
+def _lazy_substate(name: str, factory: Callable) -> property:
+    """Property that builds a panel sub-state on first access.
+
+    The value lives in the ``_<name>`` slot; assigning replaces it.
+    """
+    slot = f"_{name}"
+
+    def get(self):
+        value = getattr(self, slot)
+        if value is None:
+            value = factory()
+            setattr(self, slot, value)
+        return value
+
+    def set(self, value):
+        setattr(self, slot, value)
+
+    return property(get, set, doc=f"{factory.__name__}, created on first access.")
+
+
+class Flags(IntFlag):
+    """One bit per boolean SwarmState field; member names match the fields."""
+    MCP_CONNECTED = auto()
+    RAG_CONNECTED = auto()
+    TMUX_AVAILABLE = auto()
+    CLAUDE_AVAILABLE = auto()
+    RESEARCHER_ACTIVE = auto()
+    TEACHER_ACTIVE = auto()
+    REAL_SPAWN_ENABLED = auto()
+    SPAWN_CONFIRM_PENDING = auto()
+    DECOMPOSE_MODE = auto()
+    MUSEUM_VISIBLE = auto()
+    NEWSPAPER_VISIBLE = auto()
+    SCHOOL_VISIBLE = auto()
+    MCDONALDS_VISIBLE = auto()
+    BRAIN_VISIBLE = auto()
+    DAEMONS_VISIBLE = auto()
+
+
+# (flag, field name) pairs, resolved once
+_FLAG_FIELDS = tuple((flag, flag.name.lower()) for flag in Flags)
+
+
+@dataclass(slots=True)
 class SwarmState:
     """Current swarm state for the TUI."""
     wave: int = 0
@@ -84,7 +190,7 @@ class SwarmState:
     inbox_results: list = field(default_factory=list)
     # MCP connection status
     mcp_connected: bool = False
-    mcp_last_ping: Optional[datetime] = None
+    mcp_last_ping_ns: int = 0  # time.monotonic_ns() of the last successful status call
     # Wave spawn confirmation state (Wave 5)
     spawn_confirm_pending: bool = False
     # Decompose mode state (Wave 7)
@@ -93,19 +199,19 @@ class SwarmState:
     draft_tasks: list = field(default_factory=list)
     # Museum state (Wave 8)
     museum_visible: bool = False
-    museum_state: MuseumState = field(default_factory=MuseumState)
+    _museum_state: Optional[MuseumState] = field(default=None, init=False, repr=False)
     # Newspaper state (Wave 12)
     newspaper_visible: bool = False
-    newspaper_state: NewspaperState = field(default_factory=NewspaperState)
+    _newspaper_state: Optional[NewspaperState] = field(default=None, init=False, repr=False)
     # School state (Wave 10)
     school_visible: bool = False
-    school_state: SchoolState = field(default_factory=SchoolState)
+    _school_state: Optional[SchoolState] = field(default=None, init=False, repr=False)
     # McDonald's state (Wave 11)
     mcdonalds_visible: bool = False
-    mcdonalds_state: McDonaldsState = field(default_factory=McDonaldsState)
+    _mcdonalds_state: Optional[McDonaldsState] = field(default=None, init=False, repr=False)
     # Brain panel state (Wave 14)
     brain_visible: bool = False
-    brain_state: BrainPanelState = field(default_factory=BrainPanelState)
+    _brain_state: Optional[BrainPanelState] = field(default=None, init=False, repr=False)
     # RAG connection status
     rag_connected: bool = False
     # Daemon status indicators
@@ -122,28 +228,63 @@ class SwarmState:
     teacher_daemon: Optional[TeacherDaemon] = None
     # Apartments (worker pool)
     apartments_state: ApartmentsState = field(default_factory=ApartmentsState)
-    # Radio events (spawn messages)
-    radio_events: list = field(default_factory=list)
+    # Radio events (spawn messages); bounded, oldest entries fall off
+    radio_events: Deque[dict] = field(default_factory=lambda: deque(maxlen=MAX_RADIO_EVENTS))
     # Completed workers (for cemetery feedback)
-    completed_workers: list = field(default_factory=list)
+    completed_workers: Deque[CompletedWorker] = field(default_factory=lambda: deque(maxlen=MAX_COMPLETED_WORKERS))
     # Cemetery (tombstones for departed workers)
-    cemetery: list = field(default_factory=list)
+    cemetery: Deque[Tombstone] = field(default_factory=lambda: deque(maxlen=MAX_CEMETERY))
     # Daemon control panel (Wave 26)
     daemons_visible: bool = False
-    daemons_state: DaemonPanelState = field(default_factory=DaemonPanelState)
+    _daemons_state: Optional[DaemonPanelState] = field(default=None, init=False, repr=False)
     daemon_config: DaemonConfig = field(default_factory=DaemonConfig)
     # Refresh controller (Wave 27)
     refresh_controller: RefreshController = field(default_factory=RefreshController)
     # Status message manager (Wave 27.4)
     status_manager: StatusMessageManager = field(default_factory=StatusMessageManager)
-    # Thread-safe event queue for async callbacks
-    _event_queue: queue.Queue = field(default_factory=lambda: queue.Queue(maxsize=100))
-
-
-# === Constants ===
-MAX_RADIO_EVENTS = 50
-MAX_COMPLETED_WORKERS = 100
-MAX_DECOMPOSE_GOAL_LENGTH = 500
+    # Event queue for async callbacks; deque append/popleft are atomic, so
+    # producers on other threads need no lock. When full, the oldest queued
+    # event is dropped so the radio always shows the freshest ones.
+    _event_queue: Deque[dict] = field(default_factory=lambda: deque(maxlen=MAX_QUEUED_EVENTS))
+    # Set when a worker is spawned or dies, waking monitor_workers_async early
+    _worker_change: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
+
+    # Panel states are only built when a panel (or refresh) first touches
+    # them; load_state() creates a fresh SwarmState on every refresh.
+    museum_state = _lazy_substate("museum_state", MuseumState)
+    newspaper_state = _lazy_substate("newspaper_state", NewspaperState)
+    school_state = _lazy_substate("school_state", SchoolState)
+    mcdonalds_state = _lazy_substate("mcdonalds_state", McDonaldsState)
+    brain_state = _lazy_substate("brain_state", BrainPanelState)
+    daemons_state = _lazy_substate("daemons_state", DaemonPanelState)
+
+    def to_jsonable(self) -> dict:
+        """The STATE.json payload: the persisted fields only, lists copied.
+
+        Written out field by field; asdict() would recurse into the panel
+        states, daemons and queues, none of which belong in STATE.json.
+        """
+        return {
+            "wave": self.wave,
+            "active_zerglings": list(self.active_zerglings),
+            "completed_tasks": list(self.completed_tasks),
+            "pending_tasks": list(self.pending_tasks),
+            "last_updated": datetime.now().isoformat()
+        }
+
+    def get_flags(self) -> Flags:
+        """Pack the boolean fields into a Flags value (for snapshots and multi-flag tests)."""
+        flags = Flags(0)
+        for flag, name in _FLAG_FIELDS:
+            if getattr(self, name):
+                flags |= flag
+        return flags
+
+    def set_flags(self, flags: Flags, mask: Flags = ~Flags(0)) -> None:
+        """Set the boolean fields selected by mask from flags."""
+        for flag, name in _FLAG_FIELDS:
+            if mask & flag:
+                setattr(self, name, bool(flags & flag))
 
 
 # === Radio Events ===
@@ -162,32 +303,22 @@ def add_radio_event(state: SwarmState, message: str, icon: str = "\U0001f4fb"):
         "icon": icon
     }
     state.radio_events.append(event)
-    # Keep only last MAX_RADIO_EVENTS events
-    if len(state.radio_events) > MAX_RADIO_EVENTS:
-        state.radio_events = state.radio_events[-MAX_RADIO_EVENTS:]
 
 def add_radio_event_async(state: SwarmState, message: str, icon: str = "\U0001f4fb"):
-    """Thread-safe event addition for async callbacks."""
-    try:
-        state._event_queue.put_nowait({
-            "timestamp": datetime.now(),
-            "message": message,
-            "icon": icon
-        })
-    except queue.Full:
-        pass  # Drop if queue full
+    """Thread-safe event addition for async callbacks (never blocks; drops oldest when full)."""
+    state._event_queue.append({
+        "timestamp": datetime.now(),
+        "message": message,
+        "icon": icon
+    })
 
 def flush_event_queue(state: SwarmState) -> None:
     """Flush pending events from queue to radio_events list. Call from main loop."""
-    while True:
-        try:
-            event = state._event_queue.get_nowait()
-            state.radio_events.append(event)
-        except queue.Empty:
-            break
-    # Trim to max
-    if len(state.radio_events) > MAX_RADIO_EVENTS:
-        state.radio_events = state.radio_events[-MAX_RADIO_EVENTS:]
+    queue = state._event_queue
+    # Pop only what is queued now; events appended by other threads mid-drain
+    # wait for the next tick instead of being lost to a clear().
+    pop = queue.popleft
+    state.radio_events.extend(pop() for _ in range(len(queue)))
 
 
 def init_worker_pool(state: SwarmState, count: int = 10) -> SwarmState:
@@ -203,15 +334,13 @@ def init_worker_pool(state: SwarmState, count: int = 10) -> SwarmState:
     from .state import FIRST_NAMES
     import random
 
-    for _ in range(count):
-        if len(state.apartments_state.idle_workers) >= state.apartments_state.capacity:
-            break
-        name = random.choice(FIRST_NAMES)
-        # Ensure unique names
-        existing = [w.name for w in state.apartments_state.idle_workers]
-        while name in existing:
-            name = random.choice(FIRST_NAMES)
-        state.apartments_state.idle_workers.append(IdleWorker(name=name))
+    apartments = state.apartments_state
+    # Draw unique names from those not already idle; stops early instead of
+    # retrying forever once FIRST_NAMES is exhausted.
+    free_names = [n for n in FIRST_NAMES if not has_idle_worker(apartments, n)]
+    room = max(0, apartments.capacity - len(apartments.idle_workers))
+    for name in random.sample(free_names, min(count, room, len(free_names))):
+        add_worker_to_pool(apartments, IdleWorker(name=name))
 
     return state
 
@@ -285,7 +414,7 @@ def handle_worker_death(
         lines_written=lines_written,
         epitaph=epitaph,
         timestamp=datetime.now(),
-        memory_id=worker.injected_knowledge if hasattr(worker, 'injected_knowledge') else None
+        memory_id=worker.injected_knowledge
     )
     state.cemetery.append(tombstone)
 
@@ -303,22 +432,27 @@ def handle_worker_death(
         status=status,
         lines=lines_written,
         timestamp=datetime.now(),
-        memory_id=worker.injected_knowledge if hasattr(worker, 'injected_knowledge') else None,
+        memory_id=worker.injected_knowledge,
         feedback_sent=False
     )
-    state.completed_workers.append(completed)
-    # Cleanup old completed workers
-    if len(state.completed_workers) > MAX_COMPLETED_WORKERS:
-        state.completed_workers = state.completed_workers[-MAX_COMPLETED_WORKERS:]
+    state.completed_workers.append(completed)  # Oldest drops off at MAX_COMPLETED_WORKERS
 
     # Send RAG feedback if connected and memory was used
     if state.rag_connected and completed.memory_id:
         try:
             rag_client = get_rag_client()
-            loop = asyncio.get_event_loop()
-            helpful = status.upper() == "DONE"
-            loop.run_until_complete(rag_client.feedback(completed.memory_id, helpful))
-            completed.feedback_sent = True
+            loop = get_loop()
+            coro = rag_client.feedback(completed.memory_id, status.upper() == "DONE")
+            if loop.is_running():
+                # Called from monitor_workers_async (or another thread): the
+                # shared loop can't be re-entered, so send in the background
+                future = asyncio.run_coroutine_threadsafe(coro, loop)
+                future.add_done_callback(
+                    lambda f: setattr(completed, "feedback_sent", not f.cancelled() and f.exception() is None)
+                )
+            else:
+                loop.run_until_complete(coro)
+                completed.feedback_sent = True
         except Exception:
             pass  # Feedback is best-effort
 
@@ -331,18 +465,27 @@ def handle_worker_death(
     # 5. Return worker to pool (reincarnation) if they completed
     if status.upper() in ("DONE", "PARTIAL"):
         # Worker goes back to apartments for next assignment
-        state.apartments_state.idle_workers.append(IdleWorker(name=worker.name))
+        return_worker_to_pool(state.apartments_state, worker.name, worker.task_id, worker.lane)
 
+    notify_workers_changed(state)
     return state
 
 
+def notify_workers_changed(state: SwarmState) -> None:
+    """Wake monitor_workers_async ahead of its next scheduled check."""
+    state._worker_change.set()
+
+
 async def monitor_workers_async(state: SwarmState) -> None:
     """Background coroutine to monitor active workers.
 
-    Checks all active workers every second for:
+    Checks all active workers for:
     - TTL expiration (kills and marks as TIMEOUT)
     - Session completion (parses output for status)
 
+    Between checks it sleeps until the nearest TTL expiry, a spawn/death
+    notification, or MONITOR_POLL_INTERVAL, whichever comes first.
+
     Args:
         state: SwarmState to monitor and update
     """
@@ -352,7 +495,10 @@ async def monitor_workers_async(state: SwarmState) -> None:
     )
 
     while state.spawner_state.active_workers:
+        state._worker_change.clear()
         workers_to_remove = []
+        # One `tmux list-sessions` per tick, shared by every worker
+        active_sessions = get_active_tmux_sessions()
 
         for worker in state.spawner_state.active_workers:
             # Check TTL expiration
@@ -369,7 +515,6 @@ async def monitor_workers_async(state: SwarmState) -> None:
                 continue
 
             # Check if session still running
-            active_sessions = get_active_tmux_sessions()
             session_alive = worker.session_name in active_sessions
 
             if not session_alive:
@@ -385,8 +530,14 @@ async def monitor_workers_async(state: SwarmState) -> None:
             if worker in state.spawner_state.active_workers:
                 state.spawner_state.active_workers.remove(worker)
 
-        # Sleep for 1 second before next check
-        await asyncio.sleep(1)
+        # Session exits are only visible by polling tmux, so cap the wait
+        timeout = MONITOR_POLL_INTERVAL
+        for worker in state.spawner_state.active_workers:
+            timeout = min(timeout, worker.time_remaining.total_seconds())
+        try:
+            await asyncio.wait_for(state._worker_change.wait(), max(MONITOR_MIN_SLEEP, timeout))
+        except asyncio.TimeoutError:
+            pass
 
 
 def monitor_workers_sync(state: SwarmState) -> SwarmState:
@@ -406,6 +557,7 @@ def monitor_workers_sync(state: SwarmState) -> SwarmState:
     )
 
     workers_to_remove = []
+    active_sessions = get_active_tmux_sessions()
 
     for worker in state.spawner_state.active_workers:
         # Check TTL expiration
@@ -422,7 +574,6 @@ def monitor_workers_sync(state: SwarmState) -> SwarmState:
             continue
 
         # Check if session still running
-        active_sessions = get_active_tmux_sessions()
         session_alive = worker.session_name in active_sessions
 
         if not session_alive:
@@ -447,14 +598,7 @@ def mcp_connect() -> bool:
     """Connect to MCP server (sync wrapper)."""
     client = get_client()
     try:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(client.connect())
-    except RuntimeError:
-        # No event loop, create one
-        try:
-            return asyncio.run(client.connect())
-        except Exception:
-            return False
+        return get_loop().run_until_complete(client.connect())
     except Exception:
         # Connection failed (server not running, etc.)
         return False
@@ -463,11 +607,7 @@ def mcp_connect() -> bool:
 def mcp_call(method: str, params: dict = None):
     """Make a sync MCP call."""
     client = get_client()
-    try:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(client.send_command(method, params))
-    except RuntimeError:
-        return asyncio.run(client.send_command(method, params))
+    return get_loop().run_until_complete(client.send_command(method, params))
 
 
 # === RAG Brain Integration ===
@@ -475,11 +615,7 @@ def mcp_call(method: str, params: dict = None):
 def refresh_rag_state(state: SwarmState) -> SwarmState:
     """Refresh RAG Brain connection status and data."""
     rag_client = get_rag_client()
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+    loop = get_loop()
 
     async def _fetch_rag_data():
         connected = await rag_client.health()
@@ -520,7 +656,7 @@ def refresh_state_from_mcp(state: SwarmState) -> SwarmState:
         state.pending_tasks = data.get("pending_tasks", [])
         state.last_updated = data.get("last_updated", "")
         state.mcp_connected = True
-        state.mcp_last_ping = datetime.now()
+        state.mcp_last_ping_ns = time.monotonic_ns()
         state.status_manager.set_message("Connected to MCP", level="success")
     else:
         state.mcp_connected = False
@@ -538,18 +674,18 @@ def load_state() -> SwarmState:
     """Load swarm state from STATE.json and scan directories."""
     state = SwarmState()
 
+    # Land any debounced save first so we don't read a stale file
+    flush_state()
+
     # Load STATE.json
-    if STATE_FILE.exists():
-        try:
-            with open(STATE_FILE, encoding="utf-8", errors="replace") as f:
-                data = json.load(f)
-                state.wave = data.get("wave", 0)
-                state.active_zerglings = data.get("active_zerglings", [])
-                state.completed_tasks = data.get("completed_tasks", [])
-                state.pending_tasks = data.get("pending_tasks", [])
-                state.last_updated = data.get("last_updated", "")
-        except (json.JSONDecodeError, IOError):
-            pass
+    data = _read_state_file()
+    if data is not None:
+        state.wave = data.get("wave", 0)
+        # Copies, since the parsed dict is reused until the file changes
+        state.active_zerglings = list(data.get("active_zerglings", []))
+        state.completed_tasks = list(data.get("completed_tasks", []))
+        state.pending_tasks = list(data.get("pending_tasks", []))
+        state.last_updated = data.get("last_updated", "")
 
     # Scan tasks by lane
     state.tasks_by_lane = scan_tasks()
@@ -560,29 +696,119 @@ def load_state() -> SwarmState:
     return state
 
 
+def _read_state_file() -> Optional[dict]:
+    """Parsed STATE.json, re-read only when the file changes.
+
+    Writers replace the file atomically, so (inode, mtime, size) changes
+    whenever the content does. Returns None if missing or unparsable.
+    """
+    global _state_file_cache
+    try:
+        st = os.stat(STATE_FILE_STR)
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if _state_file_cache is not None and _state_file_cache[0] == key:
+            return _state_file_cache[1]
+        with open(STATE_FILE_STR, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
+    except (ValueError, IOError):  # JSONDecodeError and bad UTF-8 are ValueErrors
+        return None
+    if not isinstance(data, dict):
+        return None
+    _state_file_cache = (key, data)
+    return data
+
+
 def save_state(state: SwarmState) -> None:
-    """Save state back to STATE.json atomically."""
-    data = {
-        "wave": state.wave,
-        "active_zerglings": state.active_zerglings,
-        "completed_tasks": state.completed_tasks,
-        "pending_tasks": state.pending_tasks,
-        "last_updated": datetime.now().isoformat()
-    }
-    temp = STATE_FILE.with_suffix(".tmp")
+    """Schedule an atomic write of state to STATE.json.
+
+    Saves are debounced: the first call arms a STATE_SAVE_DELAY timer and
+    later calls in that window only replace the pending snapshot, so a burst
+    of mutations costs one encode + fsync. Use flush_state() to write now.
+    """
+    global _pending_save, _save_timer
+    data = state.to_jsonable()
+    with _save_lock:
+        _pending_save = data
+        if _save_timer is None:
+            _save_timer = threading.Timer(STATE_SAVE_DELAY, _flush_state_quietly)
+            _save_timer.daemon = True
+            _save_timer.start()
+
+
+def flush_state() -> None:
+    """Write any pending save_state() snapshot to STATE.json immediately."""
+    global _pending_save, _save_timer
+    with _save_lock:
+        data, _pending_save = _pending_save, None
+        timer, _save_timer = _save_timer, None
+        if timer is not None:
+            timer.cancel()
+        if data is not None:
+            _write_state_file(data)
+
+
+def _flush_state_quietly() -> None:
+    # Timer thread: there is no caller to raise to, and a traceback would
+    # corrupt the TUI. The next save_state() retries the write.
+    try:
+        flush_state()
+    except OSError:
+        pass
+
+
+def _state_file_key() -> Optional[tuple]:
+    try:
+        st = os.stat(STATE_FILE_STR)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _write_state_file(data: dict) -> None:
+    """Write data to STATE.json atomically.
+
+    Skipped when only last_updated differs from our previous write and no
+    one else has touched the file since; STATE.json is shared with the MCP
+    server, so every key is still written in full when it does change.
+    """
+    global _last_state_write
+    content = {k: v for k, v in data.items() if k != "last_updated"}
+    if _last_state_write is not None and _last_state_write == (_state_file_key(), content):
+        return
+
+    if orjson:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
     try:
-        with open(temp, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-            f.flush()
-            os.fsync(f.fileno())  # Ensure written to disk
-        temp.replace(STATE_FILE)
+        with open(STATE_TMP_STR, "wb") as f:
+            f.write(payload)
+            if STATE_FSYNC:
+                f.flush()
+                os.fsync(f.fileno())  # Ensure written to disk
+        os.replace(STATE_TMP_STR, STATE_FILE_STR)
     except (IOError, OSError):
         # Clean up temp file on failure
         try:
-            temp.unlink()
+            os.unlink(STATE_TMP_STR)
         except OSError:
             pass
         raise
+    _last_state_write = (_state_file_key(), content)
+
+
+atexit.register(flush_state)
+
+
+# Boolean fields carried across refreshes; connection/tool availability
+# flags are re-detected instead
+_TRANSIENT_FLAGS = (
+    Flags.RESEARCHER_ACTIVE | Flags.TEACHER_ACTIVE | Flags.RAG_CONNECTED
+    | Flags.NEWSPAPER_VISIBLE | Flags.SCHOOL_VISIBLE | Flags.MUSEUM_VISIBLE
+    | Flags.BRAIN_VISIBLE | Flags.MCDONALDS_VISIBLE | Flags.DAEMONS_VISIBLE
+    | Flags.SPAWN_CONFIRM_PENDING | Flags.DECOMPOSE_MODE
+)
 
 
 def _preserve_transient_state(old_state: SwarmState, new_state: SwarmState) -> None:
@@ -592,38 +818,30 @@ def _preserve_transient_state(old_state: SwarmState, new_state: SwarmState) -> N
     new_state.selected_task = old_state.selected_task
     # status_manager and refresh_controller are preserved below
     # Building panel states
-    new_state.museum_state = old_state.museum_state
+    # (private slots, so panels that were never opened stay unbuilt)
+    new_state._museum_state = old_state._museum_state
     new_state.apartments_state = old_state.apartments_state
-    new_state.school_state = old_state.school_state
-    new_state.mcdonalds_state = old_state.mcdonalds_state
-    new_state.newspaper_state = old_state.newspaper_state
-    new_state.brain_state = old_state.brain_state
+    new_state._school_state = old_state._school_state
+    new_state._mcdonalds_state = old_state._mcdonalds_state
+    new_state._newspaper_state = old_state._newspaper_state
+    new_state._brain_state = old_state._brain_state
     # Daemon state (CRITICAL)
     new_state.daemon_config = old_state.daemon_config
-    new_state.daemons_state = old_state.daemons_state
+    new_state._daemons_state = old_state._daemons_state
     new_state.researcher_daemon = old_state.researcher_daemon
     new_state.teacher_daemon = old_state.teacher_daemon
-    new_state.researcher_active = old_state.researcher_active
-    new_state.teacher_active = old_state.teacher_active
     # Events and history
     new_state.radio_events = old_state.radio_events
     new_state.cemetery = old_state.cemetery
     new_state.completed_workers = old_state.completed_workers
     new_state._event_queue = old_state._event_queue
+    new_state._worker_change = old_state._worker_change
     # New managers
     new_state.status_manager = old_state.status_manager
     new_state.refresh_controller = old_state.refresh_controller
-    # Visibility flags
-    new_state.newspaper_visible = old_state.newspaper_visible
-    new_state.school_visible = old_state.school_visible
-    new_state.museum_visible = old_state.museum_visible
-    new_state.brain_visible = old_state.brain_visible
-    new_state.mcdonalds_visible = old_state.mcdonalds_visible
-    new_state.daemons_visible = old_state.daemons_visible
-    new_state.rag_connected = old_state.rag_connected
+    # Daemon activity, visibility, RAG status and Wave 5/7 mode flags
+    new_state.set_flags(old_state.get_flags(), _TRANSIENT_FLAGS)
     # Wave 5/7 states
-    new_state.spawn_confirm_pending = old_state.spawn_confirm_pending
-    new_state.decompose_mode = old_state.decompose_mode
     new_state.decompose_goal = old_state.decompose_goal
     new_state.draft_tasks = old_state.draft_tasks
 
@@ -655,9 +873,73 @@ def refresh_state(state: SwarmState) -> SwarmState:
     if state.real_spawn_enabled and state.spawner_state.active_workers:
         state.spawner_state = collect_completed(state.spawner_state)
 
+    global _refresh_count
+    _refresh_count += 1
+    if _malloc_trim is not None and _refresh_count % MALLOC_TRIM_EVERY == 0:
+        gc.collect()
+        _malloc_trim(0)
+
     return state
 
 
+def _parse_task_meta(content: str) -> Tuple[str, str]:
+    """Status and type from a task card's text.
+
+    Supports both formats: "Status: PENDING" and "| Status | PENDING |".
+    """
+    status = "PENDING"
+    task_type = "TASK"
+    # Later lines win, so every candidate line is visited
+    for match in _TASK_META_LINE_RE.finditer(content):
+        line = match.group()
+        # Table format: | Status | VALUE |
+        if "| Status |" in line:
+            parts = line.split("|")
+            if len(parts) >= 3:
+                status = parts[2].strip()
+        # Key-value format: Status: VALUE
+        elif "Status:" in line:
+            status = line.split(":")[-1].strip()
+        # Table format: | Type | VALUE |
+        if "| Type |" in line:
+            parts = line.split("|")
+            if len(parts) >= 3:
+                task_type = parts[2].strip()
+        # Key-value format: Type: VALUE
+        elif "Type:" in line:
+            task_type = line.split(":")[-1].strip()
+    return status, task_type
+
+
+def read_task_meta(path: str) -> Tuple[str, str]:
+    """(status, type) of a task card, re-read only when the file changes.
+
+    Returns ("PENDING", "TASK") if the card can't be read.
+    """
+    try:
+        st = os.stat(path)
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = _task_meta_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        with open(path, encoding="utf-8", errors="replace") as f:
+            content = f.read()
+    except OSError:
+        return "PENDING", "TASK"
+    status, task_type = _parse_task_meta(content)
+    # Status/type values come from a small fixed vocabulary;
+    # intern them so every task shares one object per value
+    meta = (sys.intern(status), sys.intern(task_type))
+    _task_meta_cache[path] = (key, meta)
+    return meta
+
+
+def _prune_task_meta_cache(seen: set) -> None:
+    """Drop cards missing from the latest scan (deleted, renamed or archived)."""
+    for path in _task_meta_cache.keys() - seen:
+        del _task_meta_cache[path]
+
+
 def scan_tasks(use_mcp: bool = True) -> dict:
     """Scan TASKS directory for all task cards, using MCP when available.
 
@@ -677,51 +959,36 @@ def scan_tasks(use_mcp: bool = True) -> dict:
 
     # Fall back to file-based scanning
     tasks = {}
+    seen = set()
     for lane in LANES:
-        lane_dir = TASKS_DIR / lane
         tasks[lane] = []
-        if lane_dir.exists():
-            for task_file in lane_dir.glob("*.md"):
-                task_id = task_file.stem
-                status = "PENDING"
-                task_type = "TASK"
-                # Quick parse for status - supports both formats:
-                # "Status: PENDING" and "| Status | PENDING |"
-                try:
-                    content = task_file.read_text(encoding="utf-8", errors="replace")
-                    for line in content.split("\n"):
-                        # Table format: | Status | VALUE |
-                        if "| Status |" in line:
-                            parts = line.split("|")
-                            if len(parts) >= 3:
-                                status = parts[2].strip()
-                        # Key-value format: Status: VALUE
-                        elif "Status:" in line:
-                            status = line.split(":")[-1].strip()
-                        # Table format: | Type | VALUE |
-                        if "| Type |" in line:
-                            parts = line.split("|")
-                            if len(parts) >= 3:
-                                task_type = parts[2].strip()
-                        # Key-value format: Type: VALUE
-                        elif "Type:" in line:
-                            task_type = line.split(":")[-1].strip()
-                except IOError:
-                    pass
+        try:
+            entries = list(os.scandir(_LANE_DIR_STRS[lane]))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.endswith(".md"):
+                seen.add(entry.path)
+                status, task_type = read_task_meta(entry.path)
                 tasks[lane].append({
-                    "id": task_id,
+                    "id": entry.name[:-3],
                     "status": status,
                     "type": task_type
                 })
+    _prune_task_meta_cache(seen)
     return tasks
 
 
 def scan_inbox() -> list:
     """Scan INBOX for results."""
     results = []
-    if INBOX_DIR.exists():
-        for result_file in INBOX_DIR.glob("*_RESULT.md"):
-            task_id = result_file.stem.replace("_RESULT", "")
+    try:
+        entries = list(os.scandir(INBOX_DIR_STR))
+    except OSError:
+        return results
+    for entry in entries:
+        if entry.name.endswith("_RESULT.md"):
+            task_id = entry.name[:-3].replace("_RESULT", "")
             results.append(task_id)
     return results
 
@@ -737,13 +1004,9 @@ def fetch_tasks_from_mcp() -> dict:
         return {}
 
     tasks_by_lane = {}
-    for lane in LANES:
-        try:
-            loop = asyncio.get_event_loop()
-            response = loop.run_until_complete(client.task_list(lane))
-        except RuntimeError:
-            response = asyncio.run(client.task_list(lane))
-
+    seen = set()
+    responses = get_loop().run_until_complete(client.task_list_lanes(LANES))
+    for lane, response in zip(LANES, responses):
         if response.success and response.data:
             lane_tasks = []
             for task_data in response.data:
@@ -751,24 +1014,11 @@ def fetch_tasks_from_mcp() -> dict:
                 task_path = task_data.get("path", "")
 
                 # Try to parse status and type from file content
-                status = "PENDING"
-                task_type = "TASK"
                 if task_path:
-                    try:
-                        task_file = Path(task_path)
-                        if task_file.exists():
-                            content = task_file.read_text(encoding="utf-8", errors="replace")
-                            for line in content.split("\n"):
-                                if "| Status |" in line:
-                                    parts = line.split("|")
-                                    if len(parts) >= 3:
-                                        status = parts[2].strip()
-                                if "| Type |" in line:
-                                    parts = line.split("|")
-                                    if len(parts) >= 3:
-                                        task_type = parts[2].strip()
-                    except (IOError, OSError):
-                        pass
+                    seen.add(task_path)
+                    status, task_type = read_task_meta(task_path)
+                else:
+                    status, task_type = "PENDING", "TASK"
 
                 lane_tasks.append({
                     "id": task_id,
@@ -779,6 +1029,7 @@ def fetch_tasks_from_mcp() -> dict:
         else:
             tasks_by_lane[lane] = []
 
+    _prune_task_meta_cache(seen)
     return tasks_by_lane
 
 
@@ -894,6 +1145,14 @@ def render_header(state: SwarmState) -> Panel:
     return Panel(header_text, style="yellow", height=3)
 
 
+def count_tasks_by_status(tasks_by_lane: dict) -> dict:
+    """Per-lane Counter of task statuses, built in one pass over all tasks."""
+    return {
+        lane: Counter(task.get("status") for task in tasks)
+        for lane, tasks in tasks_by_lane.items()
+    }
+
+
 def render_buildings(state: SwarmState) -> Panel:
     """Render the 5 town buildings with Zerg workers."""
     # Town buildings by lane
@@ -909,12 +1168,18 @@ def render_buildings(state: SwarmState) -> Panel:
     for i in range(5):
         table.add_column(ratio=1)
 
+    # One pass each over tasks and workers instead of one per lane
+    status_counts = count_tasks_by_status(state.tasks_by_lane)
+    workers_by_lane = {}
+    for worker in state.spawner_state.active_workers:
+        workers_by_lane.setdefault(worker.lane, []).append(worker)
+
     buildings = []
     for i, lane in enumerate(LANES, 1):
-        tasks = state.tasks_by_lane.get(lane, [])
-        pending = sum(1 for t in tasks if t["status"] == "PENDING")
-        done = sum(1 for t in tasks if t["status"] == "DONE")
-        lane_workers = [w for w in state.spawner_state.active_workers if w.lane == lane]
+        counts = status_counts.get(lane, Counter())
+        pending = counts["PENDING"]
+        done = counts["DONE"]
+        lane_workers = workers_by_lane.get(lane, [])
 
         icon, name = BUILDINGS.get(lane, ("🏠", lane))
         selected = state.selected_building == i
@@ -1057,10 +1322,11 @@ def render_radio_panel(state: SwarmState, max_events: int = 5) -> Panel:
     content = Text()
     content.append("KZRG 98.6\n", style="bold yellow")
 
-    events = state.radio_events[-max_events:] if state.radio_events else []
+    # Newest first
+    events = list(islice(reversed(state.radio_events), max_events))
 
     if events:
-        for event in reversed(events):
+        for event in events:
             timestamp = event.get("timestamp", datetime.now())
             if isinstance(timestamp, str):
                 try:
@@ -1240,7 +1506,9 @@ def inject_rag_knowledge(task: dict, state: SwarmState) -> tuple[dict, str]:
     if lane_knowledge:
         # Get the most relevant memory (first one)
         memory = lane_knowledge[0]
-        if isinstance(memory, dict):
+        if isinstance(memory, NormalizedMemory):
+            knowledge_content = memory.content
+        elif isinstance(memory, dict):
             knowledge_content = memory.get("content", memory.get("text", ""))
         else:
             knowledge_content = str(memory)
@@ -1343,8 +1611,7 @@ def cmd_spawn_wave(state: SwarmState) -> SwarmState:
         state.spawn_confirm_pending = True
         # Show what will be spawned
         pending_count = sum(
-            len([t for t in tasks if t.get("status") == "PENDING"])
-            for tasks in state.tasks_by_lane.values()
+            counts["PENDING"] for counts in count_tasks_by_status(state.tasks_by_lane).values()
         )
         if state.real_spawn_enabled and state.tmux_available and state.claude_available:
             state.status_manager.set_message(f"Press 's' to spawn {pending_count} real workers (tmux)", level="info")
@@ -1423,6 +1690,7 @@ def cmd_spawn_wave(state: SwarmState) -> SwarmState:
             spawned = spawn_worker(task, SWARM_ROOT, state.wave, worker_name)
             if spawned:
                 state.spawner_state.active_workers.append(spawned)
+                notify_workers_changed(state)
                 spawned_count += 1
                 state.apartments_state.total_spawned += 1
 
@@ -1541,10 +1809,7 @@ def cmd_collect_results(state: SwarmState) -> SwarmState:
 
         if collected > 0:
             # Send feedback for completed workers
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
+            loop = get_loop()
 
             # Process cemetery feedback (workers with memory_ids)
             # Note: In full implementation, workers would have memory_id from pre-spawn
@@ -1701,10 +1966,7 @@ def handle_key(state: SwarmState, key: str, console: Console) -> tuple[SwarmStat
             if content:
                 # Store to RAG (async call wrapped)
                 rag_client = get_rag_client()
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
+                loop = get_loop()
                 finding = loop.run_until_complete(
                     store_to_rag(state.newspaper_state, content, "insight", [], rag_client)
                 )
@@ -1726,12 +1988,9 @@ def handle_key(state: SwarmState, key: str, console: Console) -> tuple[SwarmStat
     elif state.newspaper_visible and key == 'p':
         # Process queue
         rag_client = get_rag_client()
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
+        loop = get_loop()
         processed = loop.run_until_complete(
-            process_queue(state.newspaper_state, rag_client, chunk_file)
+            process_queue(state.newspaper_state, rag_client, iter_chunks)
         )
         state.status_manager.set_message(f"Processed {processed} items from queue", level="success")
     # Museum navigation handling
@@ -1778,11 +2037,7 @@ def handle_key(state: SwarmState, key: str, console: Console) -> tuple[SwarmStat
         state.status_manager.set_message("Brain " + ("opened" if state.brain_visible else "closed"), level="info")
     elif key == 'R':
         # Toggle researcher daemon
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        loop = get_loop()
 
         if state.researcher_daemon and state.researcher_daemon.running:
             # Stop the daemon
@@ -1807,11 +2062,7 @@ def handle_key(state: SwarmState, key: str, console: Console) -> tuple[SwarmStat
             state.status_manager.set_message("Researcher daemon started", level="success")
     elif key == 'T':
         # Toggle teacher daemon
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        loop = get_loop()
 
         if state.teacher_daemon and state.teacher_daemon.running:
             # Stop the daemon
@@ -1838,11 +2089,7 @@ def handle_key(state: SwarmState, key: str, console: Console) -> tuple[SwarmStat
     elif key == 'L':
         # Force teach all lanes now
         if state.teacher_daemon:
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+            loop = get_loop()
             loop.run_until_complete(state.teacher_daemon.teach_now())
             state.status_manager.set_message("Force-taught all lanes", level="success")
         else:
@@ -1927,14 +2174,13 @@ def main():
         for lane in LANES:
             (TASKS_DIR / lane).mkdir(exist_ok=True)
 
+    # Remember which file chunks RAG Brain already has across sessions
+    set_chunk_cache_dir(CACHE_DIR)
+
     # Auto-start daemons if configured
     if state.daemon_config.researcher_autostart or state.daemon_config.teacher_autostart:
         console.print("[dim]Auto-starting daemons...[/dim]")
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        loop = get_loop()
 
         rag_client = get_rag_client()
 
@@ -2014,10 +2260,7 @@ def main():
         pass
     finally:
         # Stop daemons if running
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
+        loop = get_loop()
 
         if state.researcher_daemon and state.researcher_daemon.running:
             loop.run_until_complete(state.researcher_daemon.stop())
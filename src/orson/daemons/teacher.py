@@ -23,7 +23,8 @@ class TeacherDaemon:
     into actionable lessons for workers in each lane.
     """
 
-    LANES = ["KERNEL", "ML", "QUANT", "DEX", "INTEGRATION"]
+    LANES = ("KERNEL", "ML", "QUANT", "DEX", "INTEGRATION")
+    _LANE_SET = frozenset(LANES)
 
     def __init__(
         self,
@@ -241,7 +242,7 @@ class TeacherDaemon:
         Args:
             lane: Lane name to teach
         """
-        if lane not in self.LANES:
+        if lane not in self._LANE_SET:
             self._log(f"Unknown lane: {lane}")
             return
 
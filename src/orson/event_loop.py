@@ -0,0 +1,50 @@
+"""
+Shared asyncio event loop for Orson's sync wrappers.
+
+The TUI calls async RAG/MCP helpers from synchronous code. Those calls
+must all run on one loop: the RAG client's aiohttp session and the
+daemons' tasks are bound to the loop they were created on.
+"""
+
+import asyncio
+import atexit
+import warnings
+from typing import Optional
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _close_loop() -> None:
+    if _loop is not None and not _loop.is_closed() and not _loop.is_running():
+        _loop.close()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide event loop, creating it on first use.
+
+    Adopts the thread's current loop if one is already set, so code that
+    still calls asyncio.get_event_loop() keeps sharing the same loop.
+    """
+    global _loop
+    if _loop is not None and not _loop.is_closed():
+        return _loop
+
+    with warnings.catch_warnings():
+        # get_event_loop() warns on 3.12+ when no loop is set yet
+        warnings.simplefilter("ignore", DeprecationWarning)
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            loop = None
+
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        if _loop is None:
+            atexit.register(_close_loop)
+    # Most of our tasks finish without suspending; run them inline (3.12+)
+    eager_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_factory is not None and loop.get_task_factory() is None:
+        loop.set_task_factory(eager_factory)
+    _loop = loop
+    return loop
@@ -9,7 +9,7 @@ import asyncio
 import json
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Any, Callable
+from typing import Optional, Any, Callable, Iterable, List, Tuple
 import websockets
 from websockets.exceptions import ConnectionClosed
 
@@ -107,13 +107,7 @@ class MCPClient:
         if timeout is None:
             timeout = OPERATION_TIMEOUTS.get(method, DEFAULT_TIMEOUT)
 
-        self.request_id += 1
-        request = {
-            "jsonrpc": "2.0",
-            "method": f"tools/{method}",
-            "params": params or {},
-            "id": self.request_id
-        }
+        request = self._make_request(method, params)
 
         try:
             await self.ws.send(json.dumps(request))
@@ -121,15 +115,7 @@ class MCPClient:
             response = json.loads(response_text)
 
             self.last_ping = datetime.now()
-
-            if "error" in response:
-                return MCPResponse(
-                    success=False,
-                    data=None,
-                    error=response["error"].get("message", "Unknown error")
-                )
-
-            return MCPResponse(success=True, data=response.get("result"))
+            return self._to_response(response)
 
         except asyncio.TimeoutError:
             return MCPResponse(success=False, data=None, error="Request timeout")
@@ -139,6 +125,69 @@ class MCPClient:
         except Exception as e:
             return MCPResponse(success=False, data=None, error=str(e))
 
+    async def send_batch(self, calls: List[Tuple[str, Optional[dict]]]) -> List[MCPResponse]:
+        """Send several commands back to back, then collect the replies.
+
+        All requests are written before any response is read, so the batch
+        waits on one round trip rather than one per call. Replies are
+        matched by JSON-RPC id and returned in the order of ``calls``.
+        """
+        if not calls:
+            return []
+        if not await self.ensure_connected():
+            return [MCPResponse(success=False, data=None, error="Connection failed") for _ in calls]
+
+        timeout = max(OPERATION_TIMEOUTS.get(method, DEFAULT_TIMEOUT) for method, _ in calls)
+        results: List[Optional[MCPResponse]] = [None] * len(calls)
+        pending = {}  # request id -> index in calls
+        error = None
+
+        try:
+            for index, (method, params) in enumerate(calls):
+                request = self._make_request(method, params)
+                pending[request["id"]] = index
+                await self.ws.send(json.dumps(request))
+
+            while pending:
+                response_text = await asyncio.wait_for(self.ws.recv(), timeout=timeout)
+                response = json.loads(response_text)
+                index = pending.pop(response.get("id"), None)
+                if index is not None:  # Otherwise a late reply to an earlier request
+                    results[index] = self._to_response(response)
+            self.last_ping = datetime.now()
+
+        except asyncio.TimeoutError:
+            error = "Request timeout"
+        except ConnectionClosed:
+            self.connected = False
+            error = "Connection closed"
+        except Exception as e:
+            error = str(e)
+
+        return [
+            r if r is not None else MCPResponse(success=False, data=None, error=error)
+            for r in results
+        ]
+
+    def _make_request(self, method: str, params: Optional[dict]) -> dict:
+        self.request_id += 1
+        return {
+            "jsonrpc": "2.0",
+            "method": f"tools/{method}",
+            "params": params or {},
+            "id": self.request_id
+        }
+
+    @staticmethod
+    def _to_response(response: dict) -> MCPResponse:
+        if "error" in response:
+            return MCPResponse(
+                success=False,
+                data=None,
+                error=response["error"].get("message", "Unknown error")
+            )
+        return MCPResponse(success=True, data=response.get("result"))
+
     async def ping(self) -> bool:
         """Check if server is responsive."""
         response = await self.send_command("health_check")
@@ -163,6 +212,10 @@ class MCPClient:
         params = {"lane": lane} if lane else {}
         return await self.send_command("task_list", params)
 
+    async def task_list_lanes(self, lanes: Iterable[str]) -> List[MCPResponse]:
+        """List tasks for several lanes in one pipelined batch."""
+        return await self.send_batch([("task_list", {"lane": lane}) for lane in lanes])
+
     async def zergling_list(self) -> MCPResponse:
         """List active zerglings."""
         return await self.send_command("zergling_list")
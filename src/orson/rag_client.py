@@ -6,11 +6,18 @@ Provides async methods for memory operations.
 """
 
 import asyncio
+import json
 import aiohttp
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Any, List
+from typing import Optional, Any, Iterator, List
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 
 @dataclass
@@ -54,48 +61,52 @@ def format_quality_display(quality: float) -> str:
         return f"🔴 {quality:.2f} Rejected by Gatekeeper"
 
 
-def chunk_file(file_path: Path, max_chunk_size: int = 500) -> List[str]:
-    """Read and chunk a file for RAG storage."""
+def iter_chunks(file_path: Path, max_chunk_size: int = 500) -> Iterator[str]:
+    """Read a file once and yield its RAG chunks lazily."""
     try:
         content = file_path.read_text(encoding="utf-8", errors="replace")
     except Exception:
-        return []
+        return
 
     if file_path.suffix in ['.py', '.js', '.ts']:
-        return _chunk_code(content, max_chunk_size)
-    return _chunk_text(content, max_chunk_size)
+        yield from _chunk_code(content, max_chunk_size)
+    else:
+        yield from _chunk_text(content, max_chunk_size)
 
 
-def _chunk_code(content: str, max_size: int) -> List[str]:
+def chunk_file(file_path: Path, max_chunk_size: int = 500) -> List[str]:
+    """Read and chunk a file for RAG storage."""
+    return list(iter_chunks(file_path, max_chunk_size))
+
+
+def _chunk_code(content: str, max_size: int) -> Iterator[str]:
     """Chunk code by logical boundaries."""
-    chunks, current, size = [], [], 0
+    current, size = [], 0
     for line in content.split('\n'):
         if size > max_size * 0.7 and line.startswith(('def ', 'class ', 'async def ')):
             if current:
-                chunks.append('\n'.join(current))
+                yield '\n'.join(current)
             current, size = [], 0
         current.append(line)
         size += len(line) + 1
         if size >= max_size:
-            chunks.append('\n'.join(current))
+            yield '\n'.join(current)
             current, size = [], 0
     if current:
-        chunks.append('\n'.join(current))
-    return chunks
+        yield '\n'.join(current)
 
 
-def _chunk_text(content: str, max_size: int) -> List[str]:
+def _chunk_text(content: str, max_size: int) -> Iterator[str]:
     """Chunk text by paragraph boundaries."""
-    chunks, current, size = [], [], 0
+    current, size = [], 0
     for para in content.split('\n\n'):
         if size + len(para) > max_size and current:
-            chunks.append('\n\n'.join(current))
+            yield '\n\n'.join(current)
             current, size = [], 0
         current.append(para)
         size += len(para) + 2
     if current:
-        chunks.append('\n\n'.join(current))
-    return chunks
+        yield '\n\n'.join(current)
 
 
 class RAGClient:
@@ -132,7 +143,7 @@ class RAGClient:
             await self._ensure_session()
             async with self.session.get(f"{self.base_url}{path}", timeout=aiohttp.ClientTimeout(total=5)) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return await resp.json(loads=_json_loads)
                 self.last_error = f"HTTP {resp.status}"
         except aiohttp.ClientError as e:
             self.last_error = f"Connection: {str(e)[:40]}"
@@ -149,7 +160,7 @@ class RAGClient:
             await self._ensure_session()
             async with self.session.post(f"{self.base_url}{path}", json=data, timeout=aiohttp.ClientTimeout(total=5)) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return await resp.json(loads=_json_loads)
                 self.last_error = f"HTTP {resp.status}"
         except aiohttp.ClientError as e:
             self.last_error = f"Connection: {str(e)[:40]}"
@@ -201,7 +212,11 @@ _client: Optional[RAGClient] = None
 
 
 def get_rag_client() -> RAGClient:
-    """Get or create the singleton RAG client."""
+    """Get or create the singleton RAG client.
+
+    The client (and its aiohttp connection pool) is shared process-wide,
+    so callers must not close it.
+    """
     global _client
     if _client is None:
         _client = RAGClient()
@@ -10,7 +10,7 @@ import hashlib
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class RefreshController:
     """Controls when UI should refresh based on state changes."""
 
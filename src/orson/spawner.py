@@ -18,7 +18,7 @@ import json
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Callable
+from typing import List, Optional, Dict, Callable, Set
 import shlex
 
 from .state import generate_worker_name, generate_short_name, WORKER_TTL_MINUTES
@@ -28,7 +28,7 @@ from .state import generate_worker_name, generate_short_name, WORKER_TTL_MINUTES
 WORKER_OUTPUT_DIR = Path("/tmp/orson-workers")
 
 
-@dataclass
+@dataclass(slots=True)
 class SpawnedWorker:
     """A worker spawned in a tmux session."""
     name: str
@@ -66,7 +66,7 @@ class SpawnedWorker:
         return min(1.0, elapsed.total_seconds() / ttl.total_seconds())
 
 
-@dataclass
+@dataclass(slots=True)
 class SpawnerState:
     """State for the spawner system."""
     active_workers: List[SpawnedWorker] = field(default_factory=list)
@@ -104,8 +104,8 @@ def check_claude_available() -> bool:
         return False
 
 
-def get_active_tmux_sessions() -> List[str]:
-    """Get list of active tmux session names."""
+def get_active_tmux_sessions() -> Set[str]:
+    """Get the set of active tmux session names."""
     try:
         result = subprocess.run(
             ["tmux", "list-sessions", "-F", "#{session_name}"],
@@ -114,10 +114,10 @@ def get_active_tmux_sessions() -> List[str]:
             timeout=5
         )
         if result.returncode == 0:
-            return [s.strip() for s in result.stdout.strip().split("\n") if s.strip()]
+            return {s.strip() for s in result.stdout.strip().split("\n") if s.strip()}
     except subprocess.SubprocessError:
         pass
-    return []
+    return set()
 
 
 def kill_tmux_session(session_name: str) -> bool:
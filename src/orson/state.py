@@ -7,10 +7,11 @@ Provides dataclass models and helper functions for state operations.
 "In Orson, we know our neighbors. Even the ones with carapace."
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Deque, List, Optional, Tuple
 import json
 import random
 import re
@@ -21,6 +22,9 @@ SWARM_ROOT = Path("/home/ubuntu/projects/zerg-swarm/SWARM")
 # Worker Time-To-Live (4 minutes as per zergling constraints)
 WORKER_TTL_MINUTES = 4
 
+# Radio log length (oldest events fall off the deque)
+MAX_EVENTS = 100
+
 # Midwestern worker names - the good folk of Orson
 FIRST_NAMES = [
     "Earl", "Barb", "Jim", "Sue", "Dale", "Peggy", "Roy", "Deb",
@@ -38,7 +42,7 @@ LAST_NAMES = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Worker:
     """An active worker in the swarm (a zergling with a Midwestern name)."""
     name: str
@@ -50,7 +54,7 @@ class Worker:
     lines_written: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CompletedWorker:
     """A worker that has finished their task and gone home for supper."""
     name: str
@@ -62,7 +66,7 @@ class CompletedWorker:
     feedback_sent: bool = False  # Whether RAG feedback was sent
 
 
-@dataclass
+@dataclass(slots=True)
 class DraftTask:
     """A task waiting in the drafts, not yet assigned."""
     lane: str
@@ -71,7 +75,7 @@ class DraftTask:
     file_path: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RadioEvent:
     """A message broadcast on the town radio (event log)."""
     timestamp: datetime
@@ -81,14 +85,14 @@ class RadioEvent:
     icon: str = "radio"  # worker, check, alert, coffee, tools
 
 
-@dataclass
+@dataclass(slots=True)
 class SwarmState:
     """The complete state of the Orson swarm."""
     wave: int = 0
     workers: List[Worker] = field(default_factory=list)
     completed: List[CompletedWorker] = field(default_factory=list)
     draft_tasks: List[DraftTask] = field(default_factory=list)
-    events: List[RadioEvent] = field(default_factory=list)
+    events: Deque[RadioEvent] = field(default_factory=lambda: deque(maxlen=MAX_EVENTS))
     goal: str = ""
     last_updated: Optional[datetime] = None
     # MCP connection status
@@ -206,7 +210,7 @@ def load_state() -> SwarmState:
         workers=workers,
         completed=completed,
         draft_tasks=draft_tasks,
-        events=[],  # Events are not persisted in STATE.json
+        events=deque(maxlen=MAX_EVENTS),  # Events are not persisted in STATE.json
         goal=data.get("goal", ""),
         last_updated=last_updated
     )
@@ -380,11 +384,7 @@ def add_event(
         message=message,
         icon=icon
     )
-    state.events.append(event)
-
-    # Keep only last 100 events
-    if len(state.events) > 100:
-        state.events = state.events[-100:]
+    state.events.append(event)  # Bounded deque evicts the oldest
 
 
 def get_worker_progress(worker: Worker) -> float:
@@ -700,7 +700,7 @@ def get_wave_stats(state: SwarmState, wave_num: int = None) -> dict:
 
 # === Cemetery & Epitaphs ===
 
-@dataclass
+@dataclass(slots=True)
 class Tombstone:
     """A tombstone in the cemetery for a worker who has completed their task."""
     worker_name: str
@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 from typing import Optional, List
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusMessage:
     """A status message with TTL and level."""
     text: str
@@ -27,7 +27,7 @@ class StatusMessage:
         return max(0, self.ttl_seconds - elapsed)
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusMessageManager:
     """Manages status messages with TTL and history."""
 
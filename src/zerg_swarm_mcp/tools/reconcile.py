@@ -7,7 +7,7 @@ from ..config import settings
 from .state import _load_state, _save_state
 
 TASKS_DIR = settings.swarm_root / "TASKS"
-LANES = ["KERNEL", "ML", "QUANT", "DEX", "INTEGRATION"]
+LANES = ("KERNEL", "ML", "QUANT", "DEX", "INTEGRATION")
 
 
 @mcp.tool(name="reconcile_state", description="Sync state with task files")
@@ -7,14 +7,15 @@ from ..config import settings
 from ..flavor import blocked, emit, SwarmEvent
 
 TASKS_DIR = settings.swarm_root / "TASKS"
-LANES = ["KERNEL", "ML", "QUANT", "DEX", "INTEGRATION"]
+LANES = ("KERNEL", "ML", "QUANT", "DEX", "INTEGRATION")
+LANE_SET = frozenset(LANES)
 
 
 @mcp.tool(name="task_list", description="List tasks by lane or status")
 async def task_list(ctx: Context, lane: str = None) -> list[dict]:
     """List task cards, optionally filtered by lane."""
     tasks = []
-    lanes_to_scan = [lane] if lane and lane in LANES else LANES
+    lanes_to_scan = (lane,) if lane in LANE_SET else LANES
     
     for ln in lanes_to_scan:
         lane_dir = TASKS_DIR / ln
@@ -53,7 +54,7 @@ async def task_create(
     objective: str
 ) -> dict:
     """Create a new task card in the specified lane."""
-    if lane not in LANES:
+    if lane not in LANE_SET:
         return {"error": f"Invalid lane: {lane}"}
     
     lane_dir = TASKS_DIR / lane
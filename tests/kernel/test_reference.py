@@ -0,0 +1,43 @@
+"""Tests for the CPU matmul reference implementation."""
+import pytest
+import numpy as np
+
+from src.kernel.reference import matmul_cpu_ref
+
+
+def test_matmul_cpu_ref_basic():
+    """Test small known product."""
+    a = np.array([[1, 2], [3, 4]], dtype=np.float32)
+    b = np.array([[5, 6], [7, 8]], dtype=np.float32)
+    result = matmul_cpu_ref(a, b)
+    assert result.dtype == np.float32
+    assert np.array_equal(result, np.array([[19, 22], [43, 50]], dtype=np.float32))
+
+
+def test_matmul_cpu_ref_reuses_out_buffer():
+    """Test that a preallocated out buffer is written and returned."""
+    np.random.seed(0)
+    a = np.random.randn(8, 4).astype(np.float32)
+    b = np.random.randn(4, 6).astype(np.float32)
+    out = np.empty((8, 6), dtype=np.float32)
+    result = matmul_cpu_ref(a, b, out=out)
+    assert result is out
+    assert np.allclose(out, np.matmul(a, b), atol=1e-5, rtol=1e-5)
+
+
+def test_validate_rejects_bad_inputs():
+    """Test the debug-mode validator raises on invalid inputs."""
+    from src.kernel.reference import _validate
+
+    a = np.ones((4, 4), dtype=np.float32)
+    with pytest.raises(TypeError):
+        _validate([[1.0]], a, None)
+    with pytest.raises(ValueError):
+        _validate(a.astype(np.float64), a, None)
+    with pytest.raises(ValueError):
+        _validate(a, np.ones((3, 4), dtype=np.float32), None)
+    with pytest.raises(ValueError):
+        _validate(np.ones((513, 4), dtype=np.float32), a, None)
+    with pytest.raises(ValueError):
+        _validate(a, a, np.empty((4, 3), dtype=np.float32))
+    _validate(a, a, np.empty((4, 4), dtype=np.float32))
@@ -0,0 +1,47 @@
+"""
+Tests for DEX config loading.
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture
+def keypair(tmp_path):
+    path = tmp_path / "id.json"
+    path.write_text("[" + ",".join(["1"] * 64) + "]")
+    return path
+
+
+def test_load_dex_config_from_toml(tmp_path, keypair):
+    """Test .toml config files are parsed with tomllib."""
+    from src.dex.config import load_dex_config
+
+    config = tmp_path / "dex.toml"
+    config.write_text(
+        f'rpc_url = "https://api.devnet.solana.com"\n'
+        f'keypair_path = "{keypair.as_posix()}"\n'
+        f'network = "devnet"\n'
+    )
+    cfg = load_dex_config(str(config))
+    assert cfg.rpc_url == "https://api.devnet.solana.com"
+    assert cfg.keypair_path == keypair.as_posix()
+    assert cfg.network == "devnet"
+
+
+def test_load_dex_config_from_json(tmp_path, keypair, monkeypatch):
+    """Test .json config files are parsed, with env vars filling gaps."""
+    from src.dex.config import load_dex_config
+
+    monkeypatch.delenv("NETWORK", raising=False)
+    monkeypatch.setenv("RPC_URL", "https://env.example")
+    config = tmp_path / "dex.json"
+    config.write_text(f'{{"keypair_path": "{keypair.as_posix()}"}}')
+    cfg = load_dex_config(str(config))
+    assert cfg.rpc_url == "https://env.example"
+    assert cfg.keypair_path == keypair.as_posix()
+    assert cfg.network == "mainnet"
@@ -0,0 +1,91 @@
+"""
+Tests for the ML MetricCollector.
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def test_metric_collector_summary_is_mean():
+    """Test get_summary returns the mean of all logged values."""
+    from src.ml.metrics import MetricCollector
+
+    mc = MetricCollector()
+    for step, value in enumerate([1.0, 2.0, 3.0, 6.0]):
+        mc.log("loss", value, step)
+    mc.log("acc", 0.5, 0)
+
+    summary = mc.get_summary()
+    assert summary["loss"] == pytest.approx(3.0)
+    assert summary["acc"] == pytest.approx(0.5)
+    assert mc.get_latest("loss") == (3, 6.0)
+    assert len(mc) == 5
+
+
+def test_metric_collector_summary_is_compensated():
+    """Test the running sum doesn't lose small values next to large ones."""
+    from src.ml.metrics import MetricCollector
+
+    mc = MetricCollector()
+    for step, value in enumerate([1e16, 1.0, -1e16, 0.1, 0.2]):
+        mc.log("loss", value, step)
+
+    assert mc.get_summary()["loss"] == pytest.approx(1.3 / 5)
+
+
+def test_metric_collector_clear_resets_summary():
+    """Test clearing a metric drops it from the summary."""
+    from src.ml.metrics import MetricCollector
+
+    mc = MetricCollector()
+    mc.log("loss", 1.0, 0)
+    mc.log("acc", 0.9, 0)
+    mc.clear("loss")
+    assert "loss" not in mc.get_summary()
+    assert mc.get_values("loss") == []
+
+    mc.log("loss", 4.0, 1)
+    assert mc.get_summary()["loss"] == pytest.approx(4.0)
+
+    mc.clear()
+    assert mc.get_summary() == {}
+    assert len(mc) == 0
+
+
+def test_metric_collector_values_survive_buffer_growth():
+    """Test values stay ordered as the buffer grows 64 -> 128 -> 256 -> 512."""
+    from src.ml.metrics import MetricCollector
+
+    mc = MetricCollector()
+    series = None
+    step = 0
+    for boundary, capacity in ((64, 64), (128, 128), (256, 256), (300, 512)):
+        while step < boundary:
+            mc.log("loss", float(step), step)
+            step += 1
+        series = series or mc._series["loss"]
+        assert len(series.values) == capacity
+        assert mc.get_values("loss") == [(i, float(i)) for i in range(boundary)]
+        assert mc.get_latest("loss") == (boundary - 1, float(boundary - 1))
+
+    assert mc.get_summary()["loss"] == pytest.approx(149.5)
+
+
+def test_metric_collector_history_is_bounded():
+    """Test only history_size samples are kept while the mean covers all."""
+    from src.ml.metrics import MetricCollector
+
+    mc = MetricCollector(history_size=100)
+    for step in range(250):
+        mc.log("loss", float(step), step)
+
+    values = mc.get_values("loss")
+    assert len(values) == 100
+    assert values[0] == (150, 150.0)
+    assert values[-1] == (249, 249.0)
+    assert mc.get_latest("loss") == (249, 249.0)
+    assert mc.get_summary()["loss"] == pytest.approx(124.5)
@@ -23,6 +23,41 @@ def test_apartments_imports():
     assert panel is not None
 
 
+def test_apartments_return_worker_replaces_stale_entry():
+    from src.orson.buildings.apartments import (
+        ApartmentsState, return_worker_to_pool, spawn_worker_from_pool
+    )
+    state = ApartmentsState()
+    return_worker_to_pool(state, "Earl", "T1", "KERNEL")
+    return_worker_to_pool(state, "Earl", "T2", "ML")
+    assert [w.name for w in state.idle_workers] == ["Earl"]
+    assert state.idle_workers[0].tasks_completed == 2
+    assert spawn_worker_from_pool(state).last_task == "T2"
+    return_worker_to_pool(state, "Earl", "T3", "ML")
+    assert state.idle_workers[0].tasks_completed == 1
+
+
+def test_ttl_cache_swr_serves_stale_and_refreshes():
+    import asyncio
+    from src.orson.buildings._cache import ttl_cache_swr
+
+    calls = []
+
+    @ttl_cache_swr(ttl=0.0, stale_ttl=60.0)
+    async def fetch(key):
+        calls.append(key)
+        return [len(calls)]
+
+    async def scenario():
+        assert await fetch("a") == [1]
+        assert await fetch("a") == [1]  # Stale: served from cache, refresh scheduled
+        await asyncio.sleep(0)
+        assert await fetch("a") == [2]
+
+    asyncio.run(scenario())
+    assert calls == ["a", "a"]
+
+
 def test_school_imports():
     from src.orson.buildings.school import SchoolState, render_school, TASK_TYPES
     state = SchoolState()
@@ -31,10 +66,18 @@ def test_school_imports():
     assert panel is not None
 
 
+def test_normalize_memory_handles_raw_formats():
+    from src.orson.buildings._memory import NormalizedMemory, normalize_memory
+    mem = normalize_memory({"text": "bounds check", "quality": 0.8})
+    assert mem == NormalizedMemory("bounds check", 0.8, "\U0001f7e2")
+    assert normalize_memory(mem) is mem
+    assert normalize_memory("plain") == NormalizedMemory("plain", 0.5, "\U0001f7e1")
+
+
 def test_mcdonalds_imports():
     from src.orson.buildings.mcdonalds import McDonaldsState, render_mcdonalds
     state = McDonaldsState()
-    assert state.queue == []
+    assert list(state.queue) == []
     panel = render_mcdonalds(state)
     assert panel is not None
 
@@ -47,6 +90,38 @@ def test_newspaper_imports():
     assert panel is not None
 
 
+def test_process_file_to_rag_skips_unchanged_chunks(tmp_path):
+    import asyncio
+    from src.orson.buildings import newspaper
+    from src.orson.buildings.newspaper import NewspaperState, process_file_to_rag
+
+    class FakeRAG:
+        def __init__(self):
+            self.calls = 0
+
+        async def remember(self, content, category, tags):
+            self.calls += 1
+            return {"id": f"m{self.calls}", "quality": 0.8}
+
+    source = tmp_path / "mod.py"
+    source.write_text("def f():\n    return 1\n")
+    rag = FakeRAG()
+    newspaper.set_chunk_cache_dir(tmp_path / "cache")
+    try:
+        first = asyncio.run(process_file_to_rag(NewspaperState(), str(source), rag))
+        assert rag.calls == 1
+        newspaper._chunk_cache = None  # Force a reload from disk, as in a new session
+        second = asyncio.run(process_file_to_rag(NewspaperState(), str(source), rag))
+        assert rag.calls == 1
+        assert [f.memory_id for f in second] == [f.memory_id for f in first]
+
+        newspaper.clear_chunk_cache()
+        asyncio.run(process_file_to_rag(NewspaperState(), str(source), rag))
+        assert rag.calls == 2
+    finally:
+        newspaper.set_chunk_cache_dir(None)
+
+
 def test_components_has_buildings():
     from src.orson.components import Building, ICONS
     assert hasattr(Building, 'MUSEUM')
@@ -543,7 +543,7 @@ def test_swarm_state_has_cemetery():
 
     state = SwarmState()
     assert hasattr(state, 'cemetery')
-    assert state.cemetery == []
+    assert list(state.cemetery) == []
 
 
 if __name__ == "__main__":